@@ -5,16 +5,35 @@ Creates and manages PowerPoint presentations through MCP protocol
 """
 
 import asyncio
+import io
 import os
+import re
+import subprocess
+import tempfile
+import zipfile
+from collections import OrderedDict, defaultdict
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from copy import deepcopy
+from functools import lru_cache
+from xml.sax.saxutils import escape
 
-import pandas as pd
-import qrcode
 from typing import Any
 from pptx import Presentation
-from pptx.util import Inches, Pt
+from pptx.util import Emu, Inches, Pt, lazyproperty
 from pptx.enum.text import PP_ALIGN
-from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE
+from pptx.shapes.autoshape import AutoShapeType
 from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import Part
+from pptx.opc.serialized import PackageWriter, _ZipPkgWriter
+from pptx.parts.chart import ChartPart
+from pptx.parts.embeddedpackage import EmbeddedXlsxPart
 from pptx.chart.data import CategoryChartData, XyChartData, BubbleChartData
 from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
 from mcp.server import Server
@@ -23,8 +42,171 @@ from mcp.types import Tool, TextContent
 # Initialize MCP server
 app = Server("powerpoint-server")
 
-# Store for presentations (in-memory, keyed by filename)
-presentations = {}
+
+class PresentationStore(MutableMapping):
+    """Open presentations keyed by filename, with a bounded number in memory.
+
+    Beyond ``capacity`` the least recently used presentations can be saved to
+    temporary files and their object trees dropped. The store itself does no
+    package I/O on assignment; _evict_presentations and _load_spilled do the
+    saving and reopening off the event loop. Iteration keeps the order in
+    which names were added.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self.capacity = max(1, capacity)
+        self._names = {}  # insertion-ordered set of every stored name
+        self._live = OrderedDict()  # name -> Presentation, least recent first
+        self._spilled = {}  # name -> (temp file path, slide count)
+        self._spill_dir = None
+
+    def __getitem__(self, name):
+        if name in self._live:
+            self._live.move_to_end(name)
+            return self._live[name]
+        # Tool calls reopen spilled decks beforehand; this is only a fallback
+        path, _ = self._spilled[name]
+        prs = Presentation(path)
+        self[name] = prs
+        return prs
+
+    def __setitem__(self, name, prs):
+        self._discard_spill(name)
+        self._names[name] = None
+        self._live[name] = prs
+        self._live.move_to_end(name)
+
+    def __delitem__(self, name):
+        del self._names[name]
+        self._live.pop(name, None)
+        self._discard_spill(name)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(list(self._names))
+
+    def __len__(self):
+        return len(self._names)
+
+    def slide_counts(self):
+        """Yield (name, slide count) pairs without reopening spilled files."""
+        for name in list(self._names):
+            if name in self._live:
+                yield name, len(self._live[name].slides)
+            else:
+                yield name, self._spilled[name][1]
+
+    def spilled_path(self, name):
+        """Return the temporary file holding a spilled presentation, else None."""
+        spilled = self._spilled.get(name)
+        return None if spilled is None else spilled[0]
+
+    def over_capacity(self) -> bool:
+        return len(self._live) > self.capacity
+
+    def live_items(self):
+        """Return (name, presentation) pairs in memory, least recent first."""
+        return list(self._live.items())
+
+    def new_spill_path(self) -> str:
+        """Create an empty temporary file for a presentation about to be spilled."""
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory(prefix="powerpoint-server-")
+        fd, path = tempfile.mkstemp(suffix=".pptx", dir=self._spill_dir.name)
+        os.close(fd)
+        return path
+
+    def mark_spilled(self, name, prs, path: str):
+        """Drop prs from memory now that it has been saved to path.
+
+        If name was replaced or removed while the file was being written, the
+        file is stale and is deleted instead.
+        """
+        if self._live.get(name) is not prs:
+            os.unlink(path)
+            return
+        del self._live[name]
+        self._spilled[name] = (path, len(prs.slides))
+
+    def _discard_spill(self, name):
+        spilled = self._spilled.pop(name, None)
+        if spilled is not None:
+            os.unlink(spilled[0])
+
+
+class _LeveledZipPkgWriter(_ZipPkgWriter):
+    """python-pptx's zip writer with a selectable compression level."""
+
+    def __init__(self, pkg_file, compression: str):
+        super().__init__(pkg_file)
+        self._compression = compression
+
+    @lazyproperty
+    def _zipf(self) -> zipfile.ZipFile:
+        method, level = ZIP_COMPRESSION[self._compression]
+        return zipfile.ZipFile(
+            self._pkg_file,
+            "w",
+            compression=method,
+            compresslevel=level,
+            strict_timestamps=False,
+        )
+
+
+class _LeveledPackageWriter(PackageWriter):
+    """PackageWriter that writes through _LeveledZipPkgWriter."""
+
+    def __init__(self, pkg_file, pkg_rels, parts, compression: str):
+        super().__init__(pkg_file, pkg_rels, parts)
+        self._compression = compression
+
+    def _write(self):
+        with _LeveledZipPkgWriter(self._pkg_file, self._compression) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
+
+
+def _live_presentation_limit(default: int = 16) -> int:
+    """Read PPTX_MAX_LIVE_PRESENTATIONS, falling back to default if unusable.
+
+    At least one presentation must stay in memory, or the deck a handler is
+    editing would be spilled again as soon as it was reopened.
+    """
+    try:
+        limit = int(os.environ.get("PPTX_MAX_LIVE_PRESENTATIONS", default))
+    except ValueError:
+        return default
+    return max(1, limit)
+
+
+# Presentations kept in memory before the least recently used is spilled to
+# a temporary file; large decks may want a lower limit
+MAX_LIVE_PRESENTATIONS = _live_presentation_limit()
+# Store for presentations (keyed by filename)
+presentations = PresentationStore(MAX_LIVE_PRESENTATIONS)
+# Tool calls run concurrently and file I/O yields to the event loop, so calls
+# naming the same presentation take its lock to avoid saving mid-edit
+presentation_locks = defaultdict(asyncio.Lock)
+# Permissions of a newly saved file, as open() would create it under the
+# process umask (read once here, since changing the umask is not thread-safe)
+_umask = os.umask(0)
+os.umask(_umask)
+NEW_FILE_MODE = 0o666 & ~_umask
+# Default output directory, resolved once at startup
+HOME_DIR = os.path.expanduser("~")
+DOWNLOADS_DIR = os.path.join(HOME_DIR, "Downloads")
+# Zip (method, level) for save_presentation's compression option; "default"
+# leaves the package to python-pptx's own writer
+ZIP_COMPRESSION = {
+    "fast": (zipfile.ZIP_DEFLATED, 1),
+    "none": (zipfile.ZIP_STORED, None),
+}
+# Widest preview and summary table read_data_file prints
+DATA_PREVIEW_MAX_COLUMNS = 20
+
 # Tracks which presentations were loaded from a .pptx template
 template_presentations: set = set()
 
@@ -36,6 +218,122 @@ CHART_TYPE_MAP = {
     "area": XL_CHART_TYPE.AREA,
 }
 
+SHAPE_TYPE_MAP = {
+    "rectangle": MSO_SHAPE.RECTANGLE,
+    "circle": MSO_SHAPE.OVAL,
+    "triangle": MSO_SHAPE.ISOSCELES_TRIANGLE,
+    "arrow": MSO_SHAPE.BLOCK_ARC,
+    "star": MSO_SHAPE.STAR_5_POINT,
+    "pentagon": MSO_SHAPE.PENTAGON,
+    "hexagon": MSO_SHAPE.HEXAGON,
+}
+
+CONNECTOR_TYPE_MAP = {
+    "straight": MSO_CONNECTOR.STRAIGHT,
+    "elbow": MSO_CONNECTOR.ELBOW,
+    "curved": MSO_CONNECTOR.CURVE,
+}
+
+RECTANGLE = AutoShapeType(MSO_SHAPE.RECTANGLE)
+
+# Flowchart step shapes, resolved to their preset geometry and base name
+FLOWCHART_SHAPE_MAP = {
+    "rectangle": RECTANGLE,
+    "diamond": AutoShapeType(MSO_SHAPE.DIAMOND),
+    "circle": AutoShapeType(MSO_SHAPE.OVAL),
+}
+
+# Colors and sizes reused inside per-item loops; built once at import time
+ACCENT_BLUE = RGBColor(68, 114, 196)
+WHITE = RGBColor(255, 255, 255)
+
+# Accent colors used by apply_theme
+THEME_COLORS = {
+    "blue": ACCENT_BLUE,
+    "red": RGBColor(192, 0, 0),
+    "green": RGBColor(112, 173, 71),
+    "purple": RGBColor(112, 48, 160),
+    "orange": RGBColor(237, 125, 49),
+    "professional": RGBColor(31, 78, 121),
+    "modern": RGBColor(91, 155, 213),
+}
+
+# Position and font size of the title box on blank-layout slides
+TITLE_BOX = (Inches(0.5), Inches(0.5), Inches(9), Inches(0.75))
+TITLE_FONT_SIZE = Pt(32)
+
+# Fixed placements (left, top, width, height) shared by the slide builders
+LEFT_COLUMN_BOX = (Inches(0.5), Inches(1.5), Inches(4), Inches(4.5))
+RIGHT_COLUMN_BOX = (Inches(5.5), Inches(1.5), Inches(4), Inches(4.5))
+CHART_BOX = (Inches(1), Inches(1.5), Inches(8), Inches(5))
+CAPTION_BOX = (Inches(0.5), Inches(6.5), Inches(9), Inches(0.5))
+TABLE_LEFT, TABLE_TOP, TABLE_WIDTH = Inches(0.5), Inches(1.5), Inches(9)
+TABLE_ROW_HEIGHT = Inches(0.8)
+TEXT_BLOCK_LEFT, TEXT_BLOCK_WIDTH = Inches(0.5), Inches(9)
+TEXT_BLOCK_HEIGHT = Inches(0.75)
+
+# Image (left, top, width) per add_image_slide layout; unknown layouts use
+# "centered", which sits higher on slides without a title
+IMAGE_LAYOUTS = {
+    "centered": (Inches(2), Inches(2), Inches(6)),
+    "title_and_image": (Inches(1), Inches(1.5), Inches(8)),
+    "image_left": (Inches(0.5), Inches(1.5), Inches(4.5)),
+    "image_right": (Inches(5), Inches(1.5), Inches(4.5)),
+}
+UNTITLED_IMAGE_TOP = Inches(1.5)
+
+# Markup for an autoshape as add_shape creates it, with slots for the fill,
+# line and first-paragraph properties; see _styled_shape_xml
+AUTOSHAPE_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="{name}"/><p:cNvSpPr/><p:nvPr/>'
+    '</p:nvSpPr><p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/>'
+    '</a:xfrm><a:prstGeom prst="{prst}"><a:avLst/></a:prstGeom>{fill}{line}'
+    '</p:spPr><p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef><a:effectRef idx="2">'
+    '<a:schemeClr val="accent1"/></a:effectRef><a:fontRef idx="minor">'
+    '<a:schemeClr val="lt1"/></a:fontRef></p:style><p:txBody>'
+    '<a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/>{paragraphs}</p:txBody>'
+    "</p:sp>"
+)
+# Markup for a text box as add_textbox creates it; see _handle_format_text
+TEXTBOX_XML = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {name_id}"/>'
+    '<p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr><p:spPr><a:xfrm>'
+    '<a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+    "{paragraphs}</p:txBody></p:sp>"
+)
+PARAGRAPH_XML = "<a:p>{pPr}{runs}</a:p>"
+RUN_XML = "<a:r><a:t>{text}</a:t></a:r>"
+# format_text block keys that set the first paragraph's font
+FONT_OPTIONS = frozenset(("font_size", "bold", "italic", "font_name", "color"))
+# Control characters python-pptx stores as _xHHHH_ escapes in run text
+CTRL_CHARS_RE = re.compile(r"[\x00-\x08\x0B-\x1F]")
+# Resolution that downscale_image reduces pictures to at their placed size
+IMAGE_TARGET_DPI = 150
+# Single-frame formats that downscale_image writes back in the same format
+RESIZABLE_IMAGE_FORMATS = frozenset(("PNG", "JPEG", "BMP"))
+# Colour arguments accepted by _rgb: "RRGGBB" with an optional leading "#"
+HEX_COLOR_RE = re.compile(r"#?[0-9A-Fa-f]{6}")
+# Bold white first-paragraph font for table header cells
+TABLE_HEADER_PPR = (
+    f'<a:pPr><a:defRPr b="1"><a:solidFill><a:srgbClr val="{WHITE}"/></a:solidFill>'
+    "</a:defRPr></a:pPr>"
+)
+
+# Straight connector markup as add_connector creates it with a line width
+FLOWCHART_CONNECTOR_XML = (
+    '<p:cxnSp><p:nvCxnSpPr><p:cNvPr id="{id}" name="Connector {n}"/><p:cNvCxnSpPr/>'
+    '<p:nvPr/></p:nvCxnSpPr><p:spPr><a:xfrm><a:off x="{x}" y="{y}"/>'
+    '<a:ext cx="0" cy="{cy}"/></a:xfrm><a:prstGeom prst="line"><a:avLst/>'
+    '</a:prstGeom><a:ln w="{w}"/></p:spPr><p:style><a:lnRef idx="2">'
+    '<a:schemeClr val="accent1"/></a:lnRef><a:fillRef idx="0">'
+    '<a:schemeClr val="accent1"/></a:fillRef><a:effectRef idx="1">'
+    '<a:schemeClr val="accent1"/></a:effectRef><a:fontRef idx="minor">'
+    '<a:schemeClr val="tx1"/></a:fontRef></p:style></p:cxnSp>'
+)
+
 
 DESIGN_PRESETS = {
     "cyber-dark": {
@@ -76,10 +374,32 @@ DESIGN_PRESETS = {
 }
 
 
+@lru_cache(maxsize=256)
+def _rgb(hex_color: str) -> RGBColor:
+    """Parse a "#RRGGBB" or "RRGGBB" colour string.
+
+    RGBColor is immutable, so parsed colours are shared between calls.
+    """
+    hex_color = hex_color.lstrip("#")
+    return RGBColor(*(int(hex_color[i : i + 2], 16) for i in (0, 2, 4)))
+
+
+def _set_solid_fill(xPr, color: RGBColor):
+    """Give a spPr/tcPr/bgPr element a solid fill of the given color.
+
+    Same result as ``fill.solid(); fill.fore_color.rgb = color`` but written
+    straight to the XML, without the FillFormat and ColorFormat proxies.
+    """
+    xPr.get_or_change_to_solidFill().get_or_change_to_srgbClr().val = str(color)
+
+
+def _set_solid_background(slide, color: RGBColor):
+    """Give a slide a solid background color with a single XML write."""
+    _set_solid_fill(slide.background._element.get_or_add_bgPr(), color)
+
+
 def _set_gradient_background(slide, colors, angle_deg=135):
     """Apply a linear gradient background to a slide via raw XML."""
-    from pptx.oxml.ns import qn
-
     bg = slide.background
     bgPr = bg._element.get_or_add_bgPr()
 
@@ -91,11 +411,7 @@ def _set_gradient_background(slide, colors, angle_deg=135):
 
     if len(colors) == 1:
         # Solid fill for single colour
-        fill = bg.fill
-        fill.solid()
-        hex_val = colors[0].lstrip("#")
-        r, g, b = int(hex_val[0:2], 16), int(hex_val[2:4], 16), int(hex_val[4:6], 16)
-        fill.fore_color.rgb = RGBColor(r, g, b)
+        _set_solid_fill(bgPr, _rgb(colors[0]))
         return
 
     # angle_deg: CSS convention (0 = top→bottom, 90 = right→left)
@@ -123,2679 +439,3220 @@ def _set_gradient_background(slide, colors, angle_deg=135):
     bgPr.insert(0, gradFill)
 
 
-def _add_design_accents(slide, accent: RGBColor, secondary: RGBColor, style: str):
-    """Add geometric accent shapes to a slide."""
-    W = slide.part.presentation.slide_width
-    H = slide.part.presentation.slide_height
-    BAR = Inches(0.06)
+def _design_accent_rects(W, H, accent: RGBColor, secondary: RGBColor, style: str):
+    """Return (left, top, width, height, color) for each accent rectangle.
 
-    def solid_rect(left, top, width, height, color: RGBColor):
-        shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
-        shape.fill.solid()
-        shape.fill.fore_color.rgb = color
-        shape.line.fill.background()
-        return shape
+    The geometry only depends on the slide size and preset, so it is computed
+    once per preset application rather than once per slide.
+    """
+    BAR = Inches(0.06)
 
     if style == "bars":
-        # Thin accent bar along the left edge
-        solid_rect(0, 0, BAR, H, accent)
-        # Thin secondary bar along the bottom
-        solid_rect(0, H - BAR, W, BAR, secondary)
+        return [
+            # Thin accent bar along the left edge
+            (0, 0, BAR, H, accent),
+            # Thin secondary bar along the bottom
+            (0, H - BAR, W, BAR, secondary),
+        ]
 
-    elif style == "corners":
+    if style == "corners":
         arm = Inches(1.8)
-        # Top-left corner: horizontal + vertical arm
-        solid_rect(0, 0, arm, BAR, accent)
-        solid_rect(0, 0, BAR, arm, accent)
-        # Bottom-right corner: horizontal + vertical arm
-        solid_rect(W - arm, H - BAR, arm, BAR, secondary)
-        solid_rect(W - BAR, H - arm, BAR, arm, secondary)
+        return [
+            # Top-left corner: horizontal + vertical arm
+            (0, 0, arm, BAR, accent),
+            (0, 0, BAR, arm, accent),
+            # Bottom-right corner: horizontal + vertical arm
+            (W - arm, H - BAR, arm, BAR, secondary),
+            (W - BAR, H - arm, BAR, arm, secondary),
+        ]
+
+    return []
+
+
+def _add_design_accents(slide, rects):
+    """Add geometric accent shapes to a slide."""
+    spTree = slide.shapes._spTree
+    shape_id = spTree.max_shape_id + 1
+    _bulk_append_shapes(
+        spTree,
+        [
+            _styled_shape_xml(
+                shape_id + i, RECTANGLE, left, top, width, height, color, line=False
+            )
+            for i, (left, top, width, height, color) in enumerate(rects)
+        ],
+    )
 
 
 def _add_title_box(slide, title):
-    tb = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(0.75))
+    """Add the standard 32pt bold slide title and return its text frame."""
+    tb = slide.shapes.add_textbox(*TITLE_BOX)
     tf = tb.text_frame
     tf.text = title
-    tf.paragraphs[0].font.size = Pt(32)
-    tf.paragraphs[0].font.bold = True
+    para = tf.paragraphs[0]
+    font = para.font
+    font.size = TITLE_FONT_SIZE
+    font.bold = True
+    return tf
+
+
+def _fill_paragraphs(text_frame, items):
+    """Replace the text frame's content with one paragraph per item.
+
+    The paragraphs are formatted as markup and parsed in one pass; line breaks
+    inside an item stay within its paragraph, as ``append_text`` does.
+    """
+    txBody = text_frame._txBody
+    txBody.clear_content()
+    if not items:
+        txBody.add_p()
+        return
+    paragraphs = "".join(_paragraphs_xml(item.replace("\n", "\v")) for item in items)
+    txBody.extend(parse_xml(f"<a:txBody {nsdecls('a')}>{paragraphs}</a:txBody>"))
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available PowerPoint tools"""
-    return [
-        Tool(
-            name="create_from_template",
-            description="Creates a presentation based on an existing .pptx template, inheriting all layouts, fonts, and theme colors. Design presets will not be applied automatically.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "template_path": {
-                        "type": "string",
-                        "description": "Absolute path to the .pptx template file",
-                    },
-                    "filename": {
-                        "type": "string",
-                        "description": "Internal name to reference this presentation",
-                    },
+def _empty_list_error(arguments, key: str):
+    """Return an error reply if ``arguments[key]`` has no items, else None."""
+    if arguments[key]:
+        return None
+    return [TextContent(type="text", text=f"Error: '{key}' must not be empty")]
+
+
+def _invalid_color_error(colors):
+    """Return an error reply for the first malformed colour, else None.
+
+    ``None`` entries are skipped, so optional colour arguments can be passed
+    straight through.
+    """
+    for color in colors:
+        if color is not None and not HEX_COLOR_RE.fullmatch(color):
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error: Invalid color '{color}', expected hex RRGGBB",
+                )
+            ]
+    return None
+
+
+def _get_presentation(filename: str, hint: str = ""):
+    """Return ``(prs, None)``, or ``(None, error reply)`` if it is not open."""
+    prs = presentations.get(filename)
+    if prs is None:
+        return None, [
+            TextContent(
+                type="text", text=f"Error: Presentation '{filename}' not found.{hint}"
+            )
+        ]
+    return prs, None
+
+
+def _slide_layout(prs, index: int):
+    """Return ``prs.slide_layouts[index]``, looked up once per presentation.
+
+    Each lookup otherwise resolves the layout part and builds a new proxy.
+    The cache lives on the Presentation itself so it goes away with it.
+    """
+    layouts = prs.__dict__.setdefault("_layouts_by_index", {})
+    layout = layouts.get(index)
+    if layout is None:
+        layout = layouts[index] = prs.slide_layouts[index]
+    return layout
+
+
+def _add_blank_slide(prs):
+    """Add a slide using the Blank layout (index 6 in the default template)."""
+    return prs.slides.add_slide(_slide_layout(prs, 6))
+
+
+def _category_chart_data(categories, series):
+    """Return CategoryChartData for the categories and (name, values) pairs.
+
+    ``series`` may be a generator; each values sequence is handed to
+    python-pptx as-is.
+    """
+    chart_data = CategoryChartData()
+    chart_data.categories = categories
+    for name, values in series:
+        chart_data.add_series(name, values)
+    return chart_data
+
+
+def _add_bullet_slide(prs, title, items):
+    """Add a Title and Content slide with one bullet per item."""
+    slide = prs.slides.add_slide(_slide_layout(prs, 1))
+    shapes = slide.shapes
+    shapes.title.text = title
+    _fill_paragraphs(shapes.placeholders[1].text_frame, items)
+    return slide
+
+
+def _clone_shape(spTree, template, shape_id: int, x: int, text=None):
+    """Append a copy of a shape element with a new id, x offset and text.
+
+    Formatting carried by the template (fill, line, paragraph properties) is
+    kept; only the first paragraph's properties survive a text replacement,
+    matching what setting ``text_frame.text`` on a formatted shape does.
+    """
+    el = deepcopy(template)
+    cNvPr = el.nvSpPr.cNvPr
+    cNvPr.id = shape_id
+    cNvPr.name = f"{cNvPr.name.rsplit(' ', 1)[0]} {shape_id - 1}"
+    el.x = x
+    if text is not None:
+        _set_shape_text(el.txBody, text)
+    spTree.append(el)
+    return el
+
+
+def _set_shape_text(txBody, text: str):
+    """Set a txBody's text, keeping the first paragraph's properties.
+
+    Each line becomes its own paragraph, as with ``text_frame.text``.
+    """
+    first_p = txBody.p_lst[0]
+    txBody.clear_content()
+    for r in first_p.content_children:
+        first_p.remove(r)
+    txBody.append(first_p)
+    lines = text.split("\n")
+    first_p.append_text(lines[0])
+    for line in lines[1:]:
+        txBody.add_p().append_text(line)
+
+
+def _copy_slide_rels(source_part, target_part):
+    """Relate target_part to what source_part's shapes reference.
+
+    The source may belong to another presentation. Images go through
+    python-pptx's SHA1 image lookup, so a picture already in the target deck
+    is reused rather than stored twice; charts get their own copy of the
+    chart part and its embedded workbook so the two slides can be edited
+    separately. Other parts are
+    shared within a deck and copied when they come from another one. The
+    layout and notes relationships are left to python-pptx. Returns a
+    mapping of source rIds to the rIds they have on the target.
+    """
+    rid_map = {}
+    package = target_part.package
+    target_rels = target_part.rels
+    for rId, rel in source_part.rels.items():
+        if rel.reltype in (RT.SLIDE_LAYOUT, RT.NOTES_SLIDE):
+            continue
+        if rel.is_external:
+            rid_map[rId] = target_rels.get_or_add_ext_rel(rel.reltype, rel.target_ref)
+            continue
+        part = rel.target_part
+        if rel.reltype == RT.IMAGE:
+            part = package.get_or_add_image_part(io.BytesIO(part.blob))
+        elif rel.reltype == RT.CHART:
+            chart_part = ChartPart.load(
+                package.next_partname(ChartPart.partname_template),
+                part.content_type,
+                package,
+                part.blob,
+            )
+            _remap_rids(chart_part._element, _copy_slide_rels(part, chart_part))
+            part = chart_part
+        elif rel.reltype == RT.PACKAGE and isinstance(source_part, ChartPart):
+            # The chart's workbook goes with it, or "Edit Data" on one copy
+            # would rewrite the other's numbers
+            part = EmbeddedXlsxPart.new(part.blob, package)
+        elif part.package is not package:
+            if rel.reltype == RT.SLIDE:
+                # A jump to a slide of another deck has nothing to point at
+                continue
+            template = re.sub(r"\d*(\.\w+)$", r"%d\1", part.partname)
+            part = Part.load(
+                package.next_partname(template), part.content_type, package, part.blob
+            )
+        rid_map[rId] = target_rels.get_or_add(rel.reltype, part)
+    return rid_map
+
+
+def _remap_rids(element, rid_map):
+    """Rewrite r:id-style attributes under element through rid_map."""
+    if not rid_map:
+        return
+    r_ns = qn("r:id").rpartition("}")[0] + "}"
+    for el in element.iter():
+        for key, value in el.attrib.items():
+            if key.startswith(r_ns) and value in rid_map:
+                el.set(key, rid_map[value])
+
+
+def _paragraphs_xml(text: str, pPr: str = "") -> str:
+    """Return ``<a:p>`` markup for text, formatted as ``text_frame.text`` would.
+
+    Each line is a paragraph, vertical tabs become line breaks and control
+    characters get python-pptx's _xHHHH_ escapes; ``pPr`` goes on the first
+    paragraph only.
+    """
+    paragraphs = []
+    for line in text.split("\n"):
+        runs = []
+        for idx, run in enumerate(line.split("\v")):
+            if idx:
+                runs.append("<a:br/>")
+            if run:
+                run = CTRL_CHARS_RE.sub(lambda m: "_x%04X_" % ord(m.group()), run)
+                runs.append(RUN_XML.format_map({"text": escape(run)}))
+        paragraphs.append(PARAGRAPH_XML.format_map({"pPr": pPr, "runs": "".join(runs)}))
+        pPr = ""
+    return "".join(paragraphs)
+
+
+def _text_block_pPr(block) -> str:
+    """Return the first-paragraph ``<a:pPr>`` for a format_text block.
+
+    Matches setting the block's options on ``paragraphs[0].font``; any option
+    key, even with a null value, creates the empty defRPr as the font
+    accessor does.
+    """
+    if not FONT_OPTIONS.intersection(block):
+        return ""
+    attrs = []
+    if "font_size" in block:
+        attrs.append(f' sz="{Pt(block["font_size"]).centipoints}"')
+    for key, attr in (("bold", "b"), ("italic", "i")):
+        if block.get(key) is not None:
+            attrs.append(f' {attr}="{1 if block[key] else 0}"')
+    children = []
+    if block.get("color") is not None:
+        children.append(
+            f'<a:solidFill><a:srgbClr val="{_rgb(block["color"])}"/></a:solidFill>'
+        )
+    if block.get("font_name") is not None:
+        typeface = escape(block["font_name"], {'"': "&quot;"})
+        children.append(f'<a:latin typeface="{typeface}"/>')
+    return f"<a:pPr><a:defRPr{''.join(attrs)}>{''.join(children)}</a:defRPr></a:pPr>"
+
+
+def _styled_shape_xml(
+    shape_id: int,
+    autoshape: AutoShapeType,
+    x: int,
+    y: int,
+    cx: int,
+    cy: int,
+    fill: RGBColor = None,
+    line: bool = True,
+    font_size=None,
+    font_color: RGBColor = None,
+    text: str = "",
+):
+    """Return ``<p:sp>`` markup for a styled autoshape, for _bulk_append_shapes.
+
+    Matches what add_shape followed by the equivalent fill, line, text and
+    first-paragraph font setters would produce, in a single format call.
+    """
+    rPr = ""
+    if font_color is not None:
+        rPr = f'<a:solidFill><a:srgbClr val="{font_color}"/></a:solidFill>'
+    if font_size is not None or rPr:
+        sz = f' sz="{font_size.centipoints}"' if font_size is not None else ""
+        pPr = f'<a:pPr algn="ctr"><a:defRPr{sz}>{rPr}</a:defRPr></a:pPr>'
+    else:
+        pPr = '<a:pPr algn="ctr"/>'
+    return AUTOSHAPE_XML.format(
+        id=shape_id,
+        name=f"{autoshape.basename} {shape_id - 1}",
+        prst=autoshape.prst,
+        x=x,
+        y=y,
+        cx=cx,
+        cy=cy,
+        fill=f'<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>' if fill else "",
+        line="" if line else "<a:ln><a:noFill/></a:ln>",
+        paragraphs=_paragraphs_xml(text, pPr),
+    )
+
+
+def _bulk_append_shapes(spTree, shape_xml):
+    """Parse pre-formatted shape elements in one pass and append them to spTree.
+
+    Returns the appended elements in order.
+    """
+    root = parse_xml(f"<p:spTree {nsdecls('a', 'p')}>{''.join(shape_xml)}</p:spTree>")
+    shapes = list(root)
+    spTree.extend(shapes)
+    return shapes
+
+
+@lru_cache(maxsize=8)
+def _parse_data_file(path: str, mtime_ns: int, size: int, sheet_name, columns):
+    """Parse a CSV, Excel or JSON data file; see _load_data_file.
+
+    ``columns`` (a tuple, or None for all) limits CSV and .xlsx reads to those
+    columns. The stat fields only serve as part of the cache key.
+    """
+    # Imported on first use: pandas is the bulk of the server's import time
+    # and only the data-file tools need it
+    import pandas as pd
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return pd.read_csv(path, usecols=list(columns) if columns else None)
+    if ext == ".json":
+        return pd.read_json(path)
+    if columns and ext == ".xlsx":
+        try:
+            return pd.read_excel(path, usecols=list(columns))
+        except ValueError:
+            # A column is missing; the full read lets the caller say which
+            pass
+    if sheet_name:
+        return pd.read_excel(path, sheet_name=sheet_name)
+    return pd.read_excel(path)
+
+
+def _read_csv_header(path: str):
+    """Return a CSV file's column labels as pd.read_csv would parse them."""
+    import pandas as pd
+
+    return pd.read_csv(path, nrows=0).columns
+
+
+def _load_data_file(path: str, sheet_name=None, columns=None, st=None):
+    """Return a data file as a DataFrame, reusing the parse while it is unchanged.
+
+    Parses are cached by absolute path, modification time and size, so an
+    edited file is read again. ``st`` is an os.stat() result the caller
+    already holds. Callers must not modify the returned frame.
+    """
+    if st is None:
+        st = os.stat(path)
+    return _parse_data_file(
+        os.path.abspath(path), st.st_mtime_ns, st.st_size, sheet_name, columns
+    )
+
+
+@lru_cache(maxsize=1)
+def _default_template():
+    """Return python-pptx's default template, parsed once as a prototype.
+
+    Only ever deep-copied, never edited or handed out.
+    """
+    return Presentation()
+
+
+def _new_presentation():
+    """Return a new presentation on the default template.
+
+    Deep-copying the parsed prototype takes well under half the time of
+    unzipping and parsing the template again.
+    """
+    return deepcopy(_default_template())
+
+
+def _load_presentations(paths):
+    """Open several .pptx files, parsing them on a small thread pool.
+
+    Unzipping and XML parsing happen largely outside the GIL, so independent
+    files load concurrently. Returns a dict mapping each path to its deck.
+    """
+    paths = list(dict.fromkeys(paths))
+    if len(paths) < 2:
+        return {path: Presentation(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=min(4, len(paths))) as pool:
+        return dict(zip(paths, pool.map(Presentation, paths)))
+
+
+def _ensure_dir(path: str):
+    """Create an output directory (if any) that does not exist yet.
+
+    Checked on every save, since the directory may have been removed since
+    the last one.
+    """
+    if path:
+        os.makedirs(path, exist_ok=True)
+
+
+def _save_package(prs, file, compression: str = "default"):
+    """Save a presentation to a path or stream with the given zip compression.
+
+    "default" is python-pptx's own deflate level; "fast" trades a slightly
+    larger file for quicker deflate and "none" stores parts uncompressed.
+    """
+    if compression == "default":
+        prs.save(file)
+        return
+    package = prs.part.package
+    _LeveledPackageWriter(
+        file, package._rels, tuple(package.iter_parts()), compression
+    )._write()
+
+
+def _save_atomic(prs, path: str, compression: str = "default"):
+    """Save a presentation so that ``path`` is never left half-written.
+
+    The package is streamed into a uniquely named temporary file next to
+    ``path`` and then moved over it in a single rename, so no full copy is
+    held in memory and concurrent saves to the same path cannot mix.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # mkstemp creates the file owner-only; give it the usual permissions
+            os.chmod(tmp_path, NEW_FILE_MODE)
+            _save_package(prs, f, compression)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+@lru_cache(maxsize=16)
+def _resized_image(path: str, mtime_ns: int, size: int, max_width, max_height):
+    """Return the image at path shrunk to at most max_width x max_height pixels.
+
+    Each axis is capped separately, since a picture given both a width and a
+    height is stretched to them anyway; with no max_height the aspect ratio is
+    kept. The format is kept too. Returns None when the image already fits or
+    is in a format that is embedded as-is. The stat fields only serve as part
+    of the cache key.
+    """
+    from PIL import Image
+
+    with Image.open(path) as im:
+        if im.format not in RESIZABLE_IMAGE_FORMATS:
+            return None
+        width = min(im.width, max_width)
+        if max_height is None:
+            height = max(1, round(im.height * width / im.width))
+        else:
+            height = min(im.height, max_height)
+        if (width, height) == im.size:
+            return None
+        image_format, exif = im.format, im.info.get("exif")
+        icc_profile = im.info.get("icc_profile")
+        resized = im.resize((width, height), Image.LANCZOS)
+    if image_format == "JPEG":
+        options = {"quality": 90, "exif": exif or b"", "icc_profile": icc_profile}
+    else:
+        options = {}
+    buf = io.BytesIO()
+    resized.save(buf, format=image_format, **options)
+    return buf.getvalue()
+
+
+def _downscaled_image(path: str, width: int, height=None):
+    """Return what to pass add_picture for an image placed at width x height EMU.
+
+    Images with more pixels than IMAGE_TARGET_DPI needs at that size are
+    resized in memory; anything else is returned as the path itself.
+    """
+    st = os.stat(path)
+    blob = _resized_image(
+        os.path.abspath(path),
+        st.st_mtime_ns,
+        st.st_size,
+        max(1, round(Emu(width).inches * IMAGE_TARGET_DPI)),
+        (
+            None
+            if height is None
+            else max(1, round(Emu(height).inches * IMAGE_TARGET_DPI))
+        ),
+    )
+    return path if blob is None else io.BytesIO(blob)
+
+
+def _set_picture_descr(picture, path: str):
+    """Give a picture added from memory its file name as alt text.
+
+    add_picture only knows the name when it is handed a path; a resized
+    image would otherwise be described as "image.<ext>".
+    """
+    picture._element.nvPicPr.cNvPr.set("descr", os.path.basename(path))
+
+
+@lru_cache(maxsize=256)
+def _qr_png(data: str) -> bytes:
+    """Render a QR code for the given data and return it as PNG bytes."""
+    # Imported on first use: qrcode pulls in Pillow, which most calls never need
+    import qrcode
+
+    qr = qrcode.QRCode(version=1, box_size=10, border=1)
+    qr.add_data(data)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+# Tool schemas are static, so the list is built once at import
+TOOLS = [
+    Tool(
+        name="create_from_template",
+        description="Creates a presentation based on an existing .pptx template, inheriting all layouts, fonts, and theme colors. Design presets will not be applied automatically.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "template_path": {
+                    "type": "string",
+                    "description": "Absolute path to the .pptx template file",
+                },
+                "filename": {
+                    "type": "string",
+                    "description": "Internal name to reference this presentation",
                 },
-                "required": ["template_path", "filename"],
             },
-        ),
-        Tool(
-            name="apply_design_preset",
-            description="Applies a modern/futuristic visual preset to all slides: gradient background + geometric accent shapes. Skipped on template-loaded presentations unless force=true.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "preset": {
-                        "type": "string",
-                        "enum": [
-                            "cyber-dark",
-                            "neon-purple",
-                            "deep-space",
-                            "minimal-dark",
-                            "electric-blue",
-                        ],
-                        "description": "Design preset name",
-                    },
-                    "force": {
-                        "type": "boolean",
-                        "description": "Apply even if presentation was loaded from a template (default false)",
-                    },
+            "required": ["template_path", "filename"],
+        },
+    ),
+    Tool(
+        name="apply_design_preset",
+        description="Applies a modern/futuristic visual preset to all slides: gradient background + geometric accent shapes. Skipped on template-loaded presentations unless force=true.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "preset": {
+                    "type": "string",
+                    "enum": [
+                        "cyber-dark",
+                        "neon-purple",
+                        "deep-space",
+                        "minimal-dark",
+                        "electric-blue",
+                    ],
+                    "description": "Design preset name",
+                },
+                "force": {
+                    "type": "boolean",
+                    "description": "Apply even if presentation was loaded from a template (default false)",
                 },
-                "required": ["filename", "preset"],
             },
-        ),
-        Tool(
-            name="create_presentation",
-            description="Creates a new PowerPoint presentation with a title slide",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Title for the presentation",
-                    },
-                    "subtitle": {
-                        "type": "string",
-                        "description": "Subtitle for the title slide (optional)",
-                    },
-                    "filename": {
-                        "type": "string",
-                        "description": "Filename to save as (e.g., 'presentation.pptx')",
-                    },
+            "required": ["filename", "preset"],
+        },
+    ),
+    Tool(
+        name="create_presentation",
+        description="Creates a new PowerPoint presentation with a title slide",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Title for the presentation",
+                },
+                "subtitle": {
+                    "type": "string",
+                    "description": "Subtitle for the title slide (optional)",
+                },
+                "filename": {
+                    "type": "string",
+                    "description": "Filename to save as (e.g., 'presentation.pptx')",
                 },
-                "required": ["title", "filename"],
             },
-        ),
-        Tool(
-            name="open_presentation",
-            description="Opens an existing PowerPoint presentation from disk",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the existing PowerPoint file",
-                    },
-                    "filename": {
-                        "type": "string",
-                        "description": "Internal name to reference this presentation (optional, defaults to basename)",
-                    },
+            "required": ["title", "filename"],
+        },
+    ),
+    Tool(
+        name="open_presentation",
+        description="Opens an existing PowerPoint presentation from disk",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the existing PowerPoint file",
+                },
+                "filename": {
+                    "type": "string",
+                    "description": "Internal name to reference this presentation (optional, defaults to basename)",
                 },
-                "required": ["file_path"],
             },
-        ),
-        Tool(
-            name="add_title_slide",
-            description="Adds a title slide to an existing presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "title": {"type": "string", "description": "Slide title"},
-                    "subtitle": {
-                        "type": "string",
-                        "description": "Slide subtitle (optional)",
-                    },
+            "required": ["file_path"],
+        },
+    ),
+    Tool(
+        name="add_title_slide",
+        description="Adds a title slide to an existing presentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "title": {"type": "string", "description": "Slide title"},
+                "subtitle": {
+                    "type": "string",
+                    "description": "Slide subtitle (optional)",
                 },
-                "required": ["filename", "title"],
             },
-        ),
-        Tool(
-            name="add_content_slide",
-            description="Adds a content slide with title and bullet points",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "title": {"type": "string", "description": "Slide title"},
-                    "content": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of bullet points or content items",
-                    },
+            "required": ["filename", "title"],
+        },
+    ),
+    Tool(
+        name="add_content_slide",
+        description="Adds a content slide with title and bullet points",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "title": {"type": "string", "description": "Slide title"},
+                "content": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of bullet points or content items",
                 },
-                "required": ["filename", "title", "content"],
             },
-        ),
-        Tool(
-            name="add_two_column_slide",
-            description="Adds a slide with two columns of content",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "title": {"type": "string", "description": "Slide title"},
-                    "left_content": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Content for left column",
-                    },
-                    "right_content": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Content for right column",
-                    },
+            "required": ["filename", "title", "content"],
+        },
+    ),
+    Tool(
+        name="add_two_column_slide",
+        description="Adds a slide with two columns of content",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "title": {"type": "string", "description": "Slide title"},
+                "left_content": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Content for left column",
+                },
+                "right_content": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Content for right column",
                 },
-                "required": ["filename", "title", "left_content", "right_content"],
             },
-        ),
-        Tool(
-            name="save_presentation",
-            description="Saves the presentation to disk",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "Full path where to save (optional, defaults to current directory)",
-                    },
+            "required": ["filename", "title", "left_content", "right_content"],
+        },
+    ),
+    Tool(
+        name="save_presentation",
+        description="Saves the presentation to disk",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "Full path where to save (optional, defaults to current directory)",
+                },
+                "compression": {
+                    "type": "string",
+                    "enum": ["default", "fast", "none"],
+                    "description": "Zip compression: 'fast' saves quicker with a slightly larger file, 'none' is quickest for intermediate saves (default: 'default')",
                 },
-                "required": ["filename"],
             },
-        ),
-        Tool(
-            name="list_presentations",
-            description="Lists all presentations currently in memory",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="add_image_slide",
-            description="Adds a slide with an image and optional title/caption",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "image_path": {
-                        "type": "string",
-                        "description": "Path to the image file",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Slide title (optional)",
-                    },
-                    "caption": {
-                        "type": "string",
-                        "description": "Image caption (optional)",
-                    },
-                    "layout": {
-                        "type": "string",
-                        "enum": [
-                            "centered",
-                            "title_and_image",
-                            "image_left",
-                            "image_right",
-                        ],
-                        "description": "Image layout style (default: centered)",
-                    },
+            "required": ["filename"],
+        },
+    ),
+    Tool(
+        name="list_presentations",
+        description="Lists all presentations currently in memory",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="add_image_slide",
+        description="Adds a slide with an image and optional title/caption",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "image_path": {
+                    "type": "string",
+                    "description": "Path to the image file",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Slide title (optional)",
+                },
+                "caption": {
+                    "type": "string",
+                    "description": "Image caption (optional)",
+                },
+                "layout": {
+                    "type": "string",
+                    "enum": [
+                        "centered",
+                        "title_and_image",
+                        "image_left",
+                        "image_right",
+                    ],
+                    "description": "Image layout style (default: centered)",
+                },
+                "downscale_image": {
+                    "type": "boolean",
+                    "description": "Shrink an image larger than its placed size needs (150 DPI) before embedding, for a smaller file (default: false)",
                 },
-                "required": ["filename", "image_path"],
             },
-        ),
-        Tool(
-            name="add_table_slide",
-            description="Adds a slide with a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "title": {"type": "string", "description": "Slide title"},
-                    "headers": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Table column headers",
-                    },
-                    "rows": {
-                        "type": "array",
-                        "items": {"type": "array", "items": {"type": "string"}},
-                        "description": "Table rows (array of arrays)",
-                    },
+            "required": ["filename", "image_path"],
+        },
+    ),
+    Tool(
+        name="add_table_slide",
+        description="Adds a slide with a table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "title": {"type": "string", "description": "Slide title"},
+                "headers": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Table column headers",
+                },
+                "rows": {
+                    "type": "array",
+                    "items": {"type": "array", "items": {"type": "string"}},
+                    "description": "Table rows (array of arrays)",
                 },
-                "required": ["filename", "title", "headers", "rows"],
             },
-        ),
-        Tool(
-            name="add_chart_slide",
-            description="Adds a slide with a chart/graph",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "title": {"type": "string", "description": "Slide title"},
-                    "chart_type": {
-                        "type": "string",
-                        "enum": ["bar", "column", "line", "pie", "area"],
-                        "description": "Type of chart to create",
-                    },
-                    "categories": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Chart categories (x-axis labels)",
-                    },
-                    "series": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "values": {
-                                    "type": "array",
-                                    "items": {"type": "number"},
-                                },
+            "required": ["filename", "title", "headers", "rows"],
+        },
+    ),
+    Tool(
+        name="add_chart_slide",
+        description="Adds a slide with a chart/graph",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "title": {"type": "string", "description": "Slide title"},
+                "chart_type": {
+                    "type": "string",
+                    "enum": ["bar", "column", "line", "pie", "area"],
+                    "description": "Type of chart to create",
+                },
+                "categories": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Chart categories (x-axis labels)",
+                },
+                "series": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "values": {
+                                "type": "array",
+                                "items": {"type": "number"},
                             },
                         },
-                        "description": "Chart data series",
                     },
+                    "description": "Chart data series",
                 },
-                "required": ["filename", "title", "chart_type", "categories", "series"],
             },
-        ),
-        Tool(
-            name="analyze_and_chart",
-            description="Analyzes a data file (CSV, JSON, Excel) and creates a chart slide",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "data_file": {
-                        "type": "string",
-                        "description": "Path to data file (CSV, JSON, or Excel)",
-                    },
-                    "chart_type": {
-                        "type": "string",
-                        "enum": ["bar", "column", "line", "pie", "area"],
-                        "description": "Type of chart to create",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Slide title (optional, auto-generated if not provided)",
-                    },
-                    "x_column": {
-                        "type": "string",
-                        "description": "Column name for x-axis/categories",
-                    },
-                    "y_columns": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Column name(s) for y-axis/values",
-                    },
+            "required": ["filename", "title", "chart_type", "categories", "series"],
+        },
+    ),
+    Tool(
+        name="analyze_and_chart",
+        description="Analyzes a data file (CSV, JSON, Excel) and creates a chart slide",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "data_file": {
+                    "type": "string",
+                    "description": "Path to data file (CSV, JSON, or Excel)",
+                },
+                "chart_type": {
+                    "type": "string",
+                    "enum": ["bar", "column", "line", "pie", "area"],
+                    "description": "Type of chart to create",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Slide title (optional, auto-generated if not provided)",
+                },
+                "x_column": {
+                    "type": "string",
+                    "description": "Column name for x-axis/categories",
+                },
+                "y_columns": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Column name(s) for y-axis/values",
                 },
-                "required": [
-                    "filename",
-                    "data_file",
-                    "chart_type",
-                    "x_column",
-                    "y_columns",
-                ],
             },
-        ),
-        Tool(
-            name="add_comparison_slide",
-            description="Adds a comparison slide with two items side-by-side",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "title": {"type": "string", "description": "Slide title"},
-                    "left_title": {
-                        "type": "string",
-                        "description": "Title for left side",
-                    },
-                    "left_content": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Left side content",
-                    },
-                    "right_title": {
-                        "type": "string",
-                        "description": "Title for right side",
-                    },
-                    "right_content": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Right side content",
-                    },
+            "required": [
+                "filename",
+                "data_file",
+                "chart_type",
+                "x_column",
+                "y_columns",
+            ],
+        },
+    ),
+    Tool(
+        name="add_comparison_slide",
+        description="Adds a comparison slide with two items side-by-side",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "title": {"type": "string", "description": "Slide title"},
+                "left_title": {
+                    "type": "string",
+                    "description": "Title for left side",
+                },
+                "left_content": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Left side content",
+                },
+                "right_title": {
+                    "type": "string",
+                    "description": "Title for right side",
+                },
+                "right_content": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Right side content",
                 },
-                "required": [
-                    "filename",
-                    "title",
-                    "left_title",
-                    "left_content",
-                    "right_title",
-                    "right_content",
-                ],
             },
-        ),
-        Tool(
-            name="add_timeline_slide",
-            description="Adds a timeline slide showing events chronologically",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "title": {"type": "string", "description": "Slide title"},
-                    "events": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "date": {"type": "string"},
-                                "event": {"type": "string"},
-                            },
+            "required": [
+                "filename",
+                "title",
+                "left_title",
+                "left_content",
+                "right_title",
+                "right_content",
+            ],
+        },
+    ),
+    Tool(
+        name="add_timeline_slide",
+        description="Adds a timeline slide showing events chronologically",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "title": {"type": "string", "description": "Slide title"},
+                "events": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "date": {"type": "string"},
+                            "event": {"type": "string"},
                         },
-                        "description": "Timeline events with dates and descriptions",
                     },
+                    "description": "Timeline events with dates and descriptions",
                 },
-                "required": ["filename", "title", "events"],
             },
-        ),
-        Tool(
-            name="format_text",
-            description="Adds a text slide with advanced formatting options",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "title": {"type": "string", "description": "Slide title"},
-                    "text_blocks": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "text": {"type": "string"},
-                                "font_size": {
-                                    "type": "number",
-                                    "description": "Font size in points",
-                                },
-                                "bold": {"type": "boolean"},
-                                "italic": {"type": "boolean"},
-                                "color": {
-                                    "type": "string",
-                                    "description": "Hex color code (e.g., '#FF0000')",
-                                },
-                                "font_name": {
-                                    "type": "string",
-                                    "description": "Font family name",
-                                },
+            "required": ["filename", "title", "events"],
+        },
+    ),
+    Tool(
+        name="format_text",
+        description="Adds a text slide with advanced formatting options",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "title": {"type": "string", "description": "Slide title"},
+                "text_blocks": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "text": {"type": "string"},
+                            "font_size": {
+                                "type": "number",
+                                "description": "Font size in points",
+                            },
+                            "bold": {"type": "boolean"},
+                            "italic": {"type": "boolean"},
+                            "color": {
+                                "type": "string",
+                                "description": "Hex color code (e.g., '#FF0000')",
+                            },
+                            "font_name": {
+                                "type": "string",
+                                "description": "Font family name",
                             },
                         },
-                        "description": "Text blocks with formatting",
                     },
+                    "description": "Text blocks with formatting",
                 },
-                "required": ["filename", "title", "text_blocks"],
             },
-        ),
-        Tool(
-            name="set_slide_background",
-            description="Sets the background (solid color, gradient, or image) for a slide",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "slide_index": {
-                        "type": "number",
-                        "description": "Slide index (0-based, -1 for last slide)",
-                    },
-                    "color": {
-                        "type": "string",
-                        "description": "Hex color for solid background (e.g. '#0A0A0F')",
-                    },
-                    "gradient_colors": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "2-3 hex colors for a linear gradient background",
-                    },
-                    "gradient_angle": {
-                        "type": "number",
-                        "description": "Gradient angle in degrees, CSS convention: 0=top→bottom, 90=right→left, 135=bottom-left→top-right (default 135)",
-                    },
-                    "image_path": {
-                        "type": "string",
-                        "description": "Path to background image",
-                    },
+            "required": ["filename", "title", "text_blocks"],
+        },
+    ),
+    Tool(
+        name="set_slide_background",
+        description="Sets the background (solid color, gradient, or image) for a slide",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "slide_index": {
+                    "type": "number",
+                    "description": "Slide index (0-based, -1 for last slide)",
+                },
+                "color": {
+                    "type": "string",
+                    "description": "Hex color for solid background (e.g. '#0A0A0F')",
+                },
+                "gradient_colors": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "2-3 hex colors for a linear gradient background",
+                },
+                "gradient_angle": {
+                    "type": "number",
+                    "description": "Gradient angle in degrees, CSS convention: 0=top→bottom, 90=right→left, 135=bottom-left→top-right (default 135)",
+                },
+                "image_path": {
+                    "type": "string",
+                    "description": "Path to background image",
+                },
+                "downscale_image": {
+                    "type": "boolean",
+                    "description": "Shrink the image to the slide size at 150 DPI before embedding, for a smaller file (default: false)",
                 },
-                "required": ["filename"],
             },
-        ),
-        Tool(
-            name="add_speaker_notes",
-            description="Adds speaker notes to a slide",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "slide_index": {
-                        "type": "number",
-                        "description": "Slide index (0-based, -1 for last slide)",
-                    },
-                    "notes": {"type": "string", "description": "Speaker notes text"},
+            "required": ["filename"],
+        },
+    ),
+    Tool(
+        name="add_speaker_notes",
+        description="Adds speaker notes to a slide",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "slide_index": {
+                    "type": "number",
+                    "description": "Slide index (0-based, -1 for last slide)",
                 },
-                "required": ["filename", "notes"],
+                "notes": {"type": "string", "description": "Speaker notes text"},
             },
-        ),
-        Tool(
-            name="read_data_file",
-            description="Reads and analyzes a data file (CSV, JSON, Excel) and returns summary statistics",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "data_file": {"type": "string", "description": "Path to data file"},
-                    "sheet_name": {
-                        "type": "string",
-                        "description": "Sheet name for Excel files (optional)",
-                    },
+            "required": ["filename", "notes"],
+        },
+    ),
+    Tool(
+        name="read_data_file",
+        description="Reads and analyzes a data file (CSV, JSON, Excel) and returns summary statistics",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "data_file": {"type": "string", "description": "Path to data file"},
+                "sheet_name": {
+                    "type": "string",
+                    "description": "Sheet name for Excel files (optional)",
                 },
-                "required": ["data_file"],
             },
-        ),
-        # Shapes and Diagrams
-        Tool(
-            name="add_shape",
-            description="Adds a shape (rectangle, circle, arrow, etc.) to a slide",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {
-                        "type": "string",
-                        "description": "The presentation filename",
-                    },
-                    "slide_index": {
-                        "type": "number",
-                        "description": "Slide index (-1 for last)",
-                    },
-                    "shape_type": {
-                        "type": "string",
-                        "enum": [
-                            "rectangle",
-                            "circle",
-                            "triangle",
-                            "arrow",
-                            "star",
-                            "pentagon",
-                            "hexagon",
-                        ],
-                        "description": "Type of shape",
-                    },
-                    "left": {
-                        "type": "number",
-                        "description": "Left position in inches",
-                    },
-                    "top": {"type": "number", "description": "Top position in inches"},
-                    "width": {"type": "number", "description": "Width in inches"},
-                    "height": {"type": "number", "description": "Height in inches"},
-                    "fill_color": {
-                        "type": "string",
-                        "description": "Fill color (hex code)",
-                    },
-                    "line_color": {
-                        "type": "string",
-                        "description": "Line color (hex code)",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Text inside shape (optional)",
-                    },
+            "required": ["data_file"],
+        },
+    ),
+    # Shapes and Diagrams
+    Tool(
+        name="add_shape",
+        description="Adds a shape (rectangle, circle, arrow, etc.) to a slide",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "The presentation filename",
+                },
+                "slide_index": {
+                    "type": "number",
+                    "description": "Slide index (-1 for last)",
+                },
+                "shape_type": {
+                    "type": "string",
+                    "enum": [
+                        "rectangle",
+                        "circle",
+                        "triangle",
+                        "arrow",
+                        "star",
+                        "pentagon",
+                        "hexagon",
+                    ],
+                    "description": "Type of shape",
+                },
+                "left": {
+                    "type": "number",
+                    "description": "Left position in inches",
+                },
+                "top": {"type": "number", "description": "Top position in inches"},
+                "width": {"type": "number", "description": "Width in inches"},
+                "height": {"type": "number", "description": "Height in inches"},
+                "fill_color": {
+                    "type": "string",
+                    "description": "Fill color (hex code)",
+                },
+                "line_color": {
+                    "type": "string",
+                    "description": "Line color (hex code)",
+                },
+                "text": {
+                    "type": "string",
+                    "description": "Text inside shape (optional)",
                 },
-                "required": [
-                    "filename",
-                    "shape_type",
-                    "left",
-                    "top",
-                    "width",
-                    "height",
-                ],
             },
-        ),
-        Tool(
-            name="add_connector",
-            description="Adds a connector line between shapes",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "slide_index": {
-                        "type": "number",
-                        "description": "Slide index (-1 for last)",
-                    },
-                    "connector_type": {
-                        "type": "string",
-                        "enum": ["straight", "elbow", "curved"],
-                        "description": "Type of connector",
-                    },
-                    "start_x": {"type": "number", "description": "Start X in inches"},
-                    "start_y": {"type": "number", "description": "Start Y in inches"},
-                    "end_x": {"type": "number", "description": "End X in inches"},
-                    "end_y": {"type": "number", "description": "End Y in inches"},
-                    "line_width": {
-                        "type": "number",
-                        "description": "Line width in points",
-                    },
-                    "line_color": {"type": "string", "description": "Line color (hex)"},
-                },
-                "required": [
-                    "filename",
-                    "connector_type",
-                    "start_x",
-                    "start_y",
-                    "end_x",
-                    "end_y",
-                ],
+            "required": [
+                "filename",
+                "shape_type",
+                "left",
+                "top",
+                "width",
+                "height",
+            ],
+        },
+    ),
+    Tool(
+        name="add_connector",
+        description="Adds a connector line between shapes",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "slide_index": {
+                    "type": "number",
+                    "description": "Slide index (-1 for last)",
+                },
+                "connector_type": {
+                    "type": "string",
+                    "enum": ["straight", "elbow", "curved"],
+                    "description": "Type of connector",
+                },
+                "start_x": {"type": "number", "description": "Start X in inches"},
+                "start_y": {"type": "number", "description": "Start Y in inches"},
+                "end_x": {"type": "number", "description": "End X in inches"},
+                "end_y": {"type": "number", "description": "End Y in inches"},
+                "line_width": {
+                    "type": "number",
+                    "description": "Line width in points",
+                },
+                "line_color": {"type": "string", "description": "Line color (hex)"},
             },
-        ),
-        Tool(
-            name="add_flowchart",
-            description="Creates a simple flowchart diagram",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "title": {"type": "string"},
-                    "steps": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "text": {"type": "string"},
-                                "shape": {
-                                    "type": "string",
-                                    "enum": ["rectangle", "diamond", "circle"],
-                                },
+            "required": [
+                "filename",
+                "connector_type",
+                "start_x",
+                "start_y",
+                "end_x",
+                "end_y",
+            ],
+        },
+    ),
+    Tool(
+        name="add_flowchart",
+        description="Creates a simple flowchart diagram",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "title": {"type": "string"},
+                "steps": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "text": {"type": "string"},
+                            "shape": {
+                                "type": "string",
+                                "enum": ["rectangle", "diamond", "circle"],
                             },
                         },
                     },
                 },
-                "required": ["filename", "title", "steps"],
             },
-        ),
-        # Advanced Charts
-        Tool(
-            name="add_scatter_chart",
-            description="Adds a scatter plot chart",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "title": {"type": "string"},
-                    "series": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "x_values": {
-                                    "type": "array",
-                                    "items": {"type": "number"},
-                                },
-                                "y_values": {
-                                    "type": "array",
-                                    "items": {"type": "number"},
-                                },
+            "required": ["filename", "title", "steps"],
+        },
+    ),
+    # Advanced Charts
+    Tool(
+        name="add_scatter_chart",
+        description="Adds a scatter plot chart",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "title": {"type": "string"},
+                "series": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "x_values": {
+                                "type": "array",
+                                "items": {"type": "number"},
+                            },
+                            "y_values": {
+                                "type": "array",
+                                "items": {"type": "number"},
                             },
                         },
                     },
                 },
-                "required": ["filename", "title", "series"],
             },
-        ),
-        Tool(
-            name="add_bubble_chart",
-            description="Adds a bubble chart (3D scatter plot)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "title": {"type": "string"},
-                    "series": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "x_values": {
-                                    "type": "array",
-                                    "items": {"type": "number"},
-                                },
-                                "y_values": {
-                                    "type": "array",
-                                    "items": {"type": "number"},
-                                },
-                                "sizes": {"type": "array", "items": {"type": "number"}},
+            "required": ["filename", "title", "series"],
+        },
+    ),
+    Tool(
+        name="add_bubble_chart",
+        description="Adds a bubble chart (3D scatter plot)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "title": {"type": "string"},
+                "series": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "x_values": {
+                                "type": "array",
+                                "items": {"type": "number"},
+                            },
+                            "y_values": {
+                                "type": "array",
+                                "items": {"type": "number"},
                             },
+                            "sizes": {"type": "array", "items": {"type": "number"}},
                         },
                     },
                 },
-                "required": ["filename", "title", "series"],
             },
-        ),
-        # Multi-image layouts
-        Tool(
-            name="add_image_grid",
-            description="Adds multiple images in a grid layout",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "title": {"type": "string"},
-                    "images": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "path": {"type": "string"},
-                                "caption": {"type": "string"},
-                            },
+            "required": ["filename", "title", "series"],
+        },
+    ),
+    # Multi-image layouts
+    Tool(
+        name="add_image_grid",
+        description="Adds multiple images in a grid layout",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "title": {"type": "string"},
+                "images": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "path": {"type": "string"},
+                            "caption": {"type": "string"},
                         },
                     },
-                    "columns": {
-                        "type": "number",
-                        "description": "Number of columns in grid",
-                    },
                 },
-                "required": ["filename", "images"],
-            },
-        ),
-        # Hyperlinks and QR Codes
-        Tool(
-            name="add_hyperlink",
-            description="Adds a text hyperlink to a slide",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "slide_index": {"type": "number"},
-                    "text": {"type": "string", "description": "Link text"},
-                    "url": {"type": "string", "description": "URL to link to"},
-                    "left": {
-                        "type": "number",
-                        "description": "Left position in inches",
-                    },
-                    "top": {"type": "number", "description": "Top position in inches"},
+                "columns": {
+                    "type": "number",
+                    "description": "Number of columns in grid",
                 },
-                "required": ["filename", "text", "url", "left", "top"],
             },
-        ),
-        Tool(
-            name="add_qr_code",
-            description="Generates and adds a QR code to a slide",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "slide_index": {"type": "number"},
-                    "data": {
-                        "type": "string",
-                        "description": "Data to encode in QR code",
-                    },
-                    "left": {
-                        "type": "number",
-                        "description": "Left position in inches",
-                    },
-                    "top": {"type": "number", "description": "Top position in inches"},
-                    "size": {"type": "number", "description": "QR code size in inches"},
+            "required": ["filename", "images"],
+        },
+    ),
+    # Hyperlinks and QR Codes
+    Tool(
+        name="add_hyperlink",
+        description="Adds a text hyperlink to a slide",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "slide_index": {"type": "number"},
+                "text": {"type": "string", "description": "Link text"},
+                "url": {"type": "string", "description": "URL to link to"},
+                "left": {
+                    "type": "number",
+                    "description": "Left position in inches",
                 },
-                "required": ["filename", "data", "left", "top"],
+                "top": {"type": "number", "description": "Top position in inches"},
             },
-        ),
-        # Sections and Organization
-        Tool(
-            name="add_section",
-            description="Adds a section header to organize slides",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "section_name": {"type": "string"},
-                    "slide_index": {
-                        "type": "number",
-                        "description": "Where to insert section",
-                    },
+            "required": ["filename", "text", "url", "left", "top"],
+        },
+    ),
+    Tool(
+        name="add_qr_code",
+        description="Generates and adds a QR code to a slide",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "slide_index": {"type": "number"},
+                "data": {
+                    "type": "string",
+                    "description": "Data to encode in QR code",
                 },
-                "required": ["filename", "section_name"],
-            },
-        ),
-        Tool(
-            name="add_agenda_slide",
-            description="Creates a table of contents/agenda slide",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "title": {"type": "string"},
-                    "items": {"type": "array", "items": {"type": "string"}},
+                "left": {
+                    "type": "number",
+                    "description": "Left position in inches",
                 },
-                "required": ["filename", "items"],
+                "top": {"type": "number", "description": "Top position in inches"},
+                "size": {"type": "number", "description": "QR code size in inches"},
             },
-        ),
-        # Slide Operations
-        Tool(
-            name="duplicate_slide",
-            description="Duplicates an existing slide",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "slide_index": {
-                        "type": "number",
-                        "description": "Index of slide to duplicate",
-                    },
+            "required": ["filename", "data", "left", "top"],
+        },
+    ),
+    # Sections and Organization
+    Tool(
+        name="add_section",
+        description="Adds a section header to organize slides",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "section_name": {"type": "string"},
+                "slide_index": {
+                    "type": "number",
+                    "description": "Where to insert section",
                 },
-                "required": ["filename", "slide_index"],
             },
-        ),
-        Tool(
-            name="delete_slide",
-            description="Deletes a slide from the presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "slide_index": {"type": "number"},
-                },
-                "required": ["filename", "slide_index"],
+            "required": ["filename", "section_name"],
+        },
+    ),
+    Tool(
+        name="add_agenda_slide",
+        description="Creates a table of contents/agenda slide",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "title": {"type": "string"},
+                "items": {"type": "array", "items": {"type": "string"}},
             },
-        ),
-        Tool(
-            name="merge_presentations",
-            description="Merges multiple presentations into one",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "output_filename": {"type": "string"},
-                    "input_files": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of presentation filenames to merge",
-                    },
+            "required": ["filename", "items"],
+        },
+    ),
+    # Slide Operations
+    Tool(
+        name="duplicate_slide",
+        description="Duplicates an existing slide",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "slide_index": {
+                    "type": "number",
+                    "description": "Index of slide to duplicate",
                 },
-                "required": ["output_filename", "input_files"],
             },
-        ),
-        # Export
-        Tool(
-            name="export_to_pdf",
-            description="Exports presentation to PDF format",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "output_path": {"type": "string", "description": "PDF output path"},
-                },
-                "required": ["filename"],
+            "required": ["filename", "slide_index"],
+        },
+    ),
+    Tool(
+        name="delete_slide",
+        description="Deletes a slide from the presentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "slide_index": {"type": "number"},
             },
-        ),
-        # Templates
-        Tool(
-            name="apply_theme",
-            description="Applies a color theme to the presentation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "theme": {
-                        "type": "string",
-                        "enum": [
-                            "blue",
-                            "red",
-                            "green",
-                            "purple",
-                            "orange",
-                            "professional",
-                            "modern",
-                        ],
-                        "description": "Theme name",
-                    },
+            "required": ["filename", "slide_index"],
+        },
+    ),
+    Tool(
+        name="merge_presentations",
+        description="Merges multiple presentations into one",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "output_filename": {"type": "string"},
+                "input_files": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of presentation filenames to merge",
                 },
-                "required": ["filename", "theme"],
             },
-        ),
-        Tool(
-            name="list_slides",
-            description="Lists all slides in a presentation with their index and title",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                },
-                "required": ["filename"],
+            "required": ["output_filename", "input_files"],
+        },
+    ),
+    # Export
+    Tool(
+        name="export_to_pdf",
+        description="Exports presentation to PDF format",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "output_path": {"type": "string", "description": "PDF output path"},
             },
-        ),
-        Tool(
-            name="get_slide_info",
-            description="Returns detailed info about a slide: shapes, text content, and layout",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "slide_index": {
-                        "type": "number",
-                        "description": "Slide index (0-based)",
-                    },
+            "required": ["filename"],
+        },
+    ),
+    # Templates
+    Tool(
+        name="apply_theme",
+        description="Applies a color theme to the presentation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "theme": {
+                    "type": "string",
+                    "enum": [
+                        "blue",
+                        "red",
+                        "green",
+                        "purple",
+                        "orange",
+                        "professional",
+                        "modern",
+                    ],
+                    "description": "Theme name",
                 },
-                "required": ["filename", "slide_index"],
             },
-        ),
-        Tool(
-            name="add_footer",
-            description="Adds footer with page numbers and text to all slides",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filename": {"type": "string"},
-                    "footer_text": {"type": "string"},
-                    "show_page_numbers": {"type": "boolean"},
-                    "show_date": {"type": "boolean"},
-                },
-                "required": ["filename"],
+            "required": ["filename", "theme"],
+        },
+    ),
+    Tool(
+        name="list_slides",
+        description="Lists all slides in a presentation with their index and title",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
             },
-        ),
-    ]
-
-
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Handle tool calls"""
-
-    if name == "create_from_template":
-        template_path = arguments["template_path"]
-        filename = arguments["filename"]
-
-        if not os.path.exists(template_path):
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Error: Template file '{template_path}' not found.",
-                )
-            ]
-
-        try:
-            prs = Presentation(template_path)
-            presentations[filename] = prs
-            template_presentations.add(filename)
-            return [
-                TextContent(
-                    type="text",
-                    text=(
-                        f"Loaded template '{template_path}' as '{filename}' "
-                        f"({len(prs.slides)} existing slides, "
-                        f"{len(prs.slide_layouts)} layouts available). "
-                        "Design presets are disabled for this file unless force=true."
-                    ),
-                )
-            ]
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error loading template: {e}")]
+            "required": ["filename"],
+        },
+    ),
+    Tool(
+        name="get_slide_info",
+        description="Returns detailed info about a slide: shapes, text content, and layout",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "slide_index": {
+                    "type": "number",
+                    "description": "Slide index (0-based)",
+                },
+            },
+            "required": ["filename", "slide_index"],
+        },
+    ),
+    Tool(
+        name="add_footer",
+        description="Adds footer with page numbers and text to all slides",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {"type": "string"},
+                "footer_text": {"type": "string"},
+                "show_page_numbers": {"type": "boolean"},
+                "show_date": {"type": "boolean"},
+            },
+            "required": ["filename"],
+        },
+    ),
+    # Batching
+    Tool(
+        name="batch_operations",
+        description="Runs several tool calls in order within a single request and returns their combined results",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filename": {
+                    "type": "string",
+                    "description": "Presentation filename used by every operation that does not set its own (optional)",
+                },
+                "operations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool": {
+                                "type": "string",
+                                "description": "Name of the tool to call",
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool",
+                            },
+                        },
+                        "required": ["tool"],
+                    },
+                    "description": "Tool calls to run, in order",
+                },
+            },
+            "required": ["operations"],
+        },
+    ),
+]
 
-    elif name == "create_presentation":
-        title = arguments["title"]
-        subtitle = arguments.get("subtitle", "")
-        filename = arguments["filename"]
 
-        # Create new presentation
-        prs = Presentation()
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available PowerPoint tools"""
+    return TOOLS
 
-        # Add title slide
-        title_slide_layout = prs.slide_layouts[0]
-        slide = prs.slides.add_slide(title_slide_layout)
 
-        title_shape = slide.shapes.title
-        subtitle_shape = slide.placeholders[1]
+async def _handle_create_from_template(arguments: Any) -> list[TextContent]:
+    template_path = arguments["template_path"]
+    filename = arguments["filename"]
 
-        title_shape.text = title
-        if subtitle:
-            subtitle_shape.text = subtitle
+    if not os.path.exists(template_path):
+        return [
+            TextContent(
+                type="text",
+                text=f"Error: Template file '{template_path}' not found.",
+            )
+        ]
 
-        # Store in memory
+    try:
+        prs = Presentation(template_path)
         presentations[filename] = prs
-
+        template_presentations.add(filename)
         return [
             TextContent(
                 type="text",
-                text=f"Created presentation '{filename}' with title: {title}",
+                text=(
+                    f"Loaded template '{template_path}' as '{filename}' "
+                    f"({len(prs.slides)} existing slides, "
+                    f"{len(prs.slide_layouts)} layouts available). "
+                    "Design presets are disabled for this file unless force=true."
+                ),
             )
         ]
+    except Exception as e:
+        return [TextContent(type="text", text=f"Error loading template: {e}")]
 
-    elif name == "add_title_slide":
-        filename = arguments["filename"]
-        title = arguments["title"]
-        subtitle = arguments.get("subtitle", "")
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Error: Presentation '{filename}' not found. Create it first.",
-                )
-            ]
+async def _handle_create_presentation(arguments: Any) -> list[TextContent]:
+    title = arguments["title"]
+    subtitle = arguments.get("subtitle", "")
+    filename = arguments["filename"]
 
-        prs = presentations[filename]
-        title_slide_layout = prs.slide_layouts[0]
-        slide = prs.slides.add_slide(title_slide_layout)
+    # Create new presentation off the event loop
+    prs = await asyncio.to_thread(_new_presentation)
 
-        title_shape = slide.shapes.title
-        subtitle_shape = slide.placeholders[1]
+    # Add title slide
+    title_slide_layout = _slide_layout(prs, 0)
+    slide = prs.slides.add_slide(title_slide_layout)
 
-        title_shape.text = title
-        if subtitle:
-            subtitle_shape.text = subtitle
+    title_shape = slide.shapes.title
+    subtitle_shape = slide.placeholders[1]
 
-        return [TextContent(type="text", text=f"Added title slide to '{filename}'")]
+    title_shape.text = title
+    if subtitle:
+        subtitle_shape.text = subtitle
 
-    elif name == "add_content_slide":
-        filename = arguments["filename"]
-        title = arguments["title"]
-        content = arguments["content"]
+    # Store in memory
+    presentations[filename] = prs
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Error: Presentation '{filename}' not found. Create it first.",
-                )
-            ]
+    return [
+        TextContent(
+            type="text",
+            text=f"Created presentation '{filename}' with title: {title}",
+        )
+    ]
 
-        prs = presentations[filename]
-        bullet_slide_layout = prs.slide_layouts[1]
-        slide = prs.slides.add_slide(bullet_slide_layout)
 
-        shapes = slide.shapes
-        title_shape = shapes.title
-        body_shape = shapes.placeholders[1]
+async def _handle_add_title_slide(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments["title"]
+    subtitle = arguments.get("subtitle", "")
 
-        title_shape.text = title
+    prs, error = _get_presentation(filename, " Create it first.")
+    if error:
+        return error
 
-        tf = body_shape.text_frame
-        for i, item in enumerate(content):
-            if i == 0:
-                tf.text = item
-            else:
-                p = tf.add_paragraph()
-                p.text = item
-                p.level = 0
+    title_slide_layout = _slide_layout(prs, 0)
+    slide = prs.slides.add_slide(title_slide_layout)
 
-        return [
-            TextContent(
-                type="text",
-                text=f"Added content slide '{title}' to '{filename}' with {len(content)} items",
-            )
-        ]
+    title_shape = slide.shapes.title
+    subtitle_shape = slide.placeholders[1]
 
-    elif name == "add_two_column_slide":
-        filename = arguments["filename"]
-        title = arguments["title"]
-        left_content = arguments["left_content"]
-        right_content = arguments["right_content"]
+    title_shape.text = title
+    if subtitle:
+        subtitle_shape.text = subtitle
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Error: Presentation '{filename}' not found. Create it first.",
-                )
-            ]
+    return [TextContent(type="text", text=f"Added title slide to '{filename}'")]
+
+
+async def _handle_add_content_slide(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments["title"]
+    content = arguments["content"]
+
+    prs, error = _get_presentation(filename, " Create it first.")
+    if error:
+        return error
+
+    _add_bullet_slide(prs, title, content)
 
-        prs = presentations[filename]
-        blank_slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(blank_slide_layout)
-
-        # Add title
-        left = Inches(0.5)
-        top = Inches(0.5)
-        width = Inches(9)
-        height = Inches(0.75)
-
-        title_box = slide.shapes.add_textbox(left, top, width, height)
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_frame.paragraphs[0].font.size = Pt(32)
-        title_frame.paragraphs[0].font.bold = True
-
-        # Left column
-        left_col = slide.shapes.add_textbox(
-            Inches(0.5), Inches(1.5), Inches(4), Inches(4.5)
+    return [
+        TextContent(
+            type="text",
+            text=f"Added content slide '{title}' to '{filename}' with {len(content)} items",
         )
-        tf_left = left_col.text_frame
-        for i, item in enumerate(left_content):
-            if i == 0:
-                tf_left.text = item
-            else:
-                p = tf_left.add_paragraph()
-                p.text = item
+    ]
+
 
-        # Right column
-        right_col = slide.shapes.add_textbox(
-            Inches(5.5), Inches(1.5), Inches(4), Inches(4.5)
+async def _handle_add_two_column_slide(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments["title"]
+    left_content = arguments["left_content"]
+    right_content = arguments["right_content"]
+
+    prs, error = _get_presentation(filename, " Create it first.")
+    if error:
+        return error
+
+    slide = _add_blank_slide(prs)
+
+    # Add title
+    _add_title_box(slide, title)
+
+    # Left column
+    left_col = slide.shapes.add_textbox(*LEFT_COLUMN_BOX)
+    _fill_paragraphs(left_col.text_frame, left_content)
+
+    # Right column
+    right_col = slide.shapes.add_textbox(*RIGHT_COLUMN_BOX)
+    _fill_paragraphs(right_col.text_frame, right_content)
+
+    return [
+        TextContent(
+            type="text", text=f"Added two-column slide '{title}' to '{filename}'"
         )
-        tf_right = right_col.text_frame
-        for i, item in enumerate(right_content):
-            if i == 0:
-                tf_right.text = item
-            else:
-                p = tf_right.add_paragraph()
-                p.text = item
+    ]
 
+
+async def _handle_save_presentation(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    output_path = arguments.get("output_path")
+    compression = arguments.get("compression", "default")
+
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    if compression != "default" and compression not in ZIP_COMPRESSION:
         return [
             TextContent(
-                type="text", text=f"Added two-column slide '{title}' to '{filename}'"
+                type="text", text=f"Error: Unsupported compression '{compression}'"
             )
         ]
 
-    elif name == "save_presentation":
-        filename = arguments["filename"]
-        output_path = arguments.get("output_path")
+    # Determine save path
+    if output_path:
+        save_path = output_path
+    else:
+        save_path = os.path.join(DOWNLOADS_DIR, filename)
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    _ensure_dir(os.path.dirname(save_path))
 
-        prs = presentations[filename]
+    # Save presentation
+    await asyncio.to_thread(_save_atomic, prs, save_path, compression)
 
-        # Determine save path
-        if output_path:
-            save_path = output_path
-        else:
-            save_path = os.path.join(os.path.expanduser("~"), "Downloads", filename)
+    return [TextContent(type="text", text=f"Saved presentation to: {save_path}")]
 
-        save_dir = os.path.dirname(save_path)
-        if save_dir:
-            os.makedirs(save_dir, exist_ok=True)
 
-        # Save presentation
-        prs.save(save_path)
+async def _handle_list_presentations(arguments: Any) -> list[TextContent]:
+    if not presentations:
+        return [TextContent(type="text", text="No presentations in memory.")]
 
-        return [TextContent(type="text", text=f"Saved presentation to: {save_path}")]
+    pres_list = []
+    for filename, slide_count in presentations.slide_counts():
+        pres_list.append(f"- {filename} ({slide_count} slides)")
+
+    return [
+        TextContent(
+            type="text", text="Presentations in memory:\n" + "\n".join(pres_list)
+        )
+    ]
 
-    elif name == "list_presentations":
-        if not presentations:
-            return [TextContent(type="text", text="No presentations in memory.")]
 
-        pres_list = []
-        for filename, prs in presentations.items():
-            slide_count = len(prs.slides)
-            pres_list.append(f"- {filename} ({slide_count} slides)")
+async def _handle_open_presentation(arguments: Any) -> list[TextContent]:
+    file_path = arguments["file_path"]
+    filename = arguments.get("filename", os.path.basename(file_path))
 
+    if not os.path.exists(file_path):
+        return [TextContent(type="text", text=f"Error: File '{file_path}' not found.")]
+
+    try:
+        prs = await asyncio.to_thread(Presentation, file_path)
+        presentations[filename] = prs
         return [
             TextContent(
-                type="text", text="Presentations in memory:\n" + "\n".join(pres_list)
+                type="text",
+                text=f"Opened presentation '{file_path}' as '{filename}' ({len(prs.slides)} slides)",
             )
         ]
+    except Exception as e:
+        return [TextContent(type="text", text=f"Error opening presentation: {str(e)}")]
 
-    elif name == "open_presentation":
-        file_path = arguments["file_path"]
-        filename = arguments.get("filename", os.path.basename(file_path))
 
-        if not os.path.exists(file_path):
-            return [
-                TextContent(type="text", text=f"Error: File '{file_path}' not found.")
-            ]
+async def _handle_add_image_slide(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    image_path = arguments["image_path"]
+    title = arguments.get("title")
+    caption = arguments.get("caption")
+    layout = arguments.get("layout", "centered")
 
-        try:
-            prs = Presentation(file_path)
-            presentations[filename] = prs
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Opened presentation '{file_path}' as '{filename}' ({len(prs.slides)} slides)",
-                )
-            ]
-        except Exception as e:
-            return [
-                TextContent(type="text", text=f"Error opening presentation: {str(e)}")
-            ]
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-    elif name == "add_image_slide":
-        filename = arguments["filename"]
-        image_path = arguments["image_path"]
-        title = arguments.get("title")
-        caption = arguments.get("caption")
-        layout = arguments.get("layout", "centered")
+    if not os.path.exists(image_path):
+        return [
+            TextContent(
+                type="text", text=f"Error: Image file '{image_path}' not found."
+            )
+        ]
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    slide = _add_blank_slide(prs)
 
-        if not os.path.exists(image_path):
-            return [
-                TextContent(
-                    type="text", text=f"Error: Image file '{image_path}' not found."
-                )
-            ]
+    # Add title if provided
+    if title:
+        _add_title_box(slide, title)
 
-        prs = presentations[filename]
-        blank_slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(blank_slide_layout)
+    # Determine image position based on layout
+    left, top, width = IMAGE_LAYOUTS.get(layout, IMAGE_LAYOUTS["centered"])
+    if layout == "centered" and not title:
+        top = UNTITLED_IMAGE_TOP
 
-        # Add title if provided
-        if title:
-            title_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(0.5), Inches(9), Inches(0.75)
-            )
-            title_frame = title_box.text_frame
-            title_frame.text = title
-            title_frame.paragraphs[0].font.size = Pt(32)
-            title_frame.paragraphs[0].font.bold = True
-
-        # Determine image position based on layout
-        if layout == "centered":
-            left = Inches(2)
-            top = Inches(2) if title else Inches(1.5)
-            width = Inches(6)
-        elif layout == "title_and_image":
-            left = Inches(1)
-            top = Inches(1.5)
-            width = Inches(8)
-        elif layout == "image_left":
-            left = Inches(0.5)
-            top = Inches(1.5)
-            width = Inches(4.5)
-        elif layout == "image_right":
-            left = Inches(5)
-            top = Inches(1.5)
-            width = Inches(4.5)
-        else:
-            left = Inches(2)
-            top = Inches(2)
-            width = Inches(6)
+    if arguments.get("downscale_image"):
+        image = _downscaled_image(image_path, width)
+    else:
+        image = image_path
+    picture = slide.shapes.add_picture(image, left, top, width=width)
+    if image is not image_path:
+        _set_picture_descr(picture, image_path)
 
-        slide.shapes.add_picture(image_path, left, top, width=width)
+    # Add caption if provided
+    if caption:
+        caption_box = slide.shapes.add_textbox(*CAPTION_BOX)
+        caption_frame = caption_box.text_frame
+        caption_frame.text = caption
+        caption_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
 
-        # Add caption if provided
-        if caption:
-            caption_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(6.5), Inches(9), Inches(0.5)
-            )
-            caption_frame = caption_box.text_frame
-            caption_frame.text = caption
-            caption_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+    return [TextContent(type="text", text=f"Added image slide to '{filename}'")]
 
-        return [TextContent(type="text", text=f"Added image slide to '{filename}'")]
 
-    elif name == "add_table_slide":
-        filename = arguments["filename"]
-        title = arguments["title"]
-        headers = arguments["headers"]
-        rows = arguments["rows"]
+async def _handle_add_table_slide(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments["title"]
+    headers = arguments["headers"]
+    rows = arguments["rows"]
 
-        if filename not in presentations:
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    for i, row_data in enumerate(rows):
+        if len(row_data) > len(headers):
             return [
                 TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
+                    type="text",
+                    text=f"Error: Row {i} has {len(row_data)} cells but there are "
+                    f"only {len(headers)} headers",
                 )
             ]
 
-        prs = presentations[filename]
-        blank_slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(blank_slide_layout)
+    slide = _add_blank_slide(prs)
+
+    # Add title
+    _add_title_box(slide, title)
+
+    # Add table
+    row_count = len(rows) + 1  # +1 for header
+    col_count = len(headers)
+    height = TABLE_ROW_HEIGHT * row_count
+
+    table = slide.shapes.add_table(
+        row_count, col_count, TABLE_LEFT, TABLE_TOP, TABLE_WIDTH, height
+    ).table
+
+    # Format every cell's paragraphs up front and parse them in one pass
+    tr_lst = table._tbl.tr_lst
+    header_tcs = tr_lst[0].tc_lst
+    tcs = header_tcs[: len(headers)]
+    bodies = [_paragraphs_xml(header, TABLE_HEADER_PPR) for header in headers]
+    for tr, row_data in zip(tr_lst[1:], rows):
+        tcs.extend(tr.tc_lst[: len(row_data)])
+        bodies.extend(_paragraphs_xml(str(cell_value)) for cell_value in row_data)
+    parsed = parse_xml(
+        f"<a:tbl {nsdecls('a')}>"
+        + "".join(f"<a:txBody>{body}</a:txBody>" for body in bodies)
+        + "</a:tbl>"
+    )
+    for tc, txBody in zip(tcs, parsed):
+        tc.txBody.clear_content()
+        tc.txBody.extend(txBody)
+
+    for tc in header_tcs:
+        _set_solid_fill(tc.get_or_add_tcPr(), ACCENT_BLUE)
 
-        # Add title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.5), Inches(9), Inches(0.75)
+    return [
+        TextContent(
+            type="text",
+            text=f"Added table slide to '{filename}' with {len(rows)} rows",
         )
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_frame.paragraphs[0].font.size = Pt(32)
-        title_frame.paragraphs[0].font.bold = True
-
-        # Add table
-        row_count = len(rows) + 1  # +1 for header
-        col_count = len(headers)
-        left = Inches(0.5)
-        top = Inches(1.5)
-        width = Inches(9)
-        height = Inches(0.8) * row_count
-
-        table = slide.shapes.add_table(
-            row_count, col_count, left, top, width, height
-        ).table
-
-        # Set headers
-        for col_idx, header in enumerate(headers):
-            cell = table.cell(0, col_idx)
-            cell.text = header
-            cell.text_frame.paragraphs[0].font.bold = True
-            cell.fill.solid()
-            cell.fill.fore_color.rgb = RGBColor(68, 114, 196)
-            cell.text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
-
-        # Set data rows
-        for row_idx, row_data in enumerate(rows):
-            for col_idx, cell_value in enumerate(row_data):
-                table.cell(row_idx + 1, col_idx).text = str(cell_value)
+    ]
+
+
+async def _handle_add_chart_slide(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments["title"]
+    chart_type = arguments["chart_type"]
+    categories = arguments["categories"]
+    series = arguments["series"]
 
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    chart_enum = CHART_TYPE_MAP.get(chart_type)
+    if chart_enum is None:
         return [
             TextContent(
-                type="text",
-                text=f"Added table slide to '{filename}' with {len(rows)} rows",
+                type="text", text=f"Error: Unsupported chart type '{chart_type}'"
             )
         ]
 
-    elif name == "add_chart_slide":
-        filename = arguments["filename"]
-        title = arguments["title"]
-        chart_type = arguments["chart_type"]
-        categories = arguments["categories"]
-        series = arguments["series"]
+    error = _empty_list_error(arguments, "series")
+    if error:
+        return error
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    slide = _add_blank_slide(prs)
 
-        prs = presentations[filename]
-        blank_slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(blank_slide_layout)
+    # Add title
+    _add_title_box(slide, title)
 
-        # Add title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.5), Inches(9), Inches(0.75)
-        )
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_frame.paragraphs[0].font.size = Pt(32)
-        title_frame.paragraphs[0].font.bold = True
+    chart_data = _category_chart_data(
+        categories, ((s["name"], s["values"]) for s in series)
+    )
+
+    x, y, cx, cy = CHART_BOX
+    chart = slide.shapes.add_chart(chart_enum, x, y, cx, cy, chart_data).chart
+
+    chart.has_legend = True
+    chart.legend.position = XL_LEGEND_POSITION.RIGHT
 
-        chart_data = CategoryChartData()
-        chart_data.categories = categories
+    return [
+        TextContent(type="text", text=f"Added {chart_type} chart slide to '{filename}'")
+    ]
 
-        for s in series:
-            chart_data.add_series(s["name"], s["values"])
 
-        x, y, cx, cy = Inches(1), Inches(1.5), Inches(8), Inches(5)
-        chart = slide.shapes.add_chart(
-            CHART_TYPE_MAP[chart_type], x, y, cx, cy, chart_data
-        ).chart
+async def _handle_analyze_and_chart(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    data_file = arguments["data_file"]
+    chart_type = arguments["chart_type"]
+    title = arguments.get("title")
+    x_column = arguments["x_column"]
+    y_columns = arguments["y_columns"]
 
-        chart.has_legend = True
-        chart.legend.position = XL_LEGEND_POSITION.RIGHT
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
+    chart_enum = CHART_TYPE_MAP.get(chart_type)
+    if chart_enum is None:
         return [
             TextContent(
-                type="text", text=f"Added {chart_type} chart slide to '{filename}'"
+                type="text", text=f"Error: Unsupported chart type '{chart_type}'"
             )
         ]
 
-    elif name == "analyze_and_chart":
-        filename = arguments["filename"]
-        data_file = arguments["data_file"]
-        chart_type = arguments["chart_type"]
-        title = arguments.get("title")
-        x_column = arguments["x_column"]
-        y_columns = arguments["y_columns"]
+    try:
+        st = os.stat(data_file)
+    except OSError:
+        return [
+            TextContent(type="text", text=f"Error: Data file '{data_file}' not found.")
+        ]
 
-        if filename not in presentations:
+    try:
+        # Read data file
+        ext = os.path.splitext(data_file)[1].lower()
+        wanted_columns = tuple(dict.fromkeys([x_column, *y_columns]))
+        if ext == ".csv":
+            # Peek at the header only; the rows are parsed once the charted
+            # columns are known to exist
+            columns = await asyncio.to_thread(_read_csv_header, data_file)
+        elif ext in [".xlsx", ".xls", ".json"]:
+            df = await asyncio.to_thread(
+                _load_data_file,
+                data_file,
+                columns=wanted_columns if ext == ".xlsx" else None,
+                st=st,
+            )
+            columns = df.columns
+        else:
             return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
+                TextContent(type="text", text=f"Error: Unsupported file format '{ext}'")
             ]
 
-        if not os.path.exists(data_file):
+        # Validate columns
+        if x_column not in columns:
             return [
                 TextContent(
-                    type="text", text=f"Error: Data file '{data_file}' not found."
+                    type="text",
+                    text=f"Error: Column '{x_column}' not found in data",
                 )
             ]
 
-        try:
-            # Read data file
-            ext = os.path.splitext(data_file)[1].lower()
-            if ext == ".csv":
-                df = pd.read_csv(data_file)
-            elif ext in [".xlsx", ".xls"]:
-                df = pd.read_excel(data_file)
-            elif ext == ".json":
-                df = pd.read_json(data_file)
-            else:
-                return [
-                    TextContent(
-                        type="text", text=f"Error: Unsupported file format '{ext}'"
-                    )
-                ]
-
-            # Validate columns
-            if x_column not in df.columns:
+        for col in y_columns:
+            if col not in columns:
                 return [
                     TextContent(
-                        type="text",
-                        text=f"Error: Column '{x_column}' not found in data",
+                        type="text", text=f"Error: Column '{col}' not found in data"
                     )
                 ]
 
-            for col in y_columns:
-                if col not in df.columns:
-                    return [
-                        TextContent(
-                            type="text", text=f"Error: Column '{col}' not found in data"
-                        )
-                    ]
-
-            # Create chart
-            categories = df[x_column].astype(str).tolist()
-            series = []
-            for y_col in y_columns:
-                series.append({"name": y_col, "values": df[y_col].tolist()})
-
-            # Auto-generate title if not provided
-            if not title:
-                title = f"{', '.join(y_columns)} by {x_column}"
-
-            prs = presentations[filename]
-            slide = prs.slides.add_slide(prs.slide_layouts[6])
-            _add_title_box(slide, title)
-
-            chart_data = CategoryChartData()
-            chart_data.categories = categories
-            for s in series:
-                chart_data.add_series(s["name"], s["values"])
-
-            x, y, cx, cy = Inches(1), Inches(1.5), Inches(8), Inches(5)
-            chart = slide.shapes.add_chart(
-                CHART_TYPE_MAP[chart_type], x, y, cx, cy, chart_data
-            ).chart
-            chart.has_legend = True
-            chart.legend.position = XL_LEGEND_POSITION.RIGHT
-
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Analyzed '{data_file}' and added {chart_type} chart to '{filename}' ({len(df)} data points)",
-                )
-            ]
-
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error analyzing data: {str(e)}")]
-
-    elif name == "add_comparison_slide":
-        filename = arguments["filename"]
-        title = arguments["title"]
-        left_title = arguments["left_title"]
-        left_content = arguments["left_content"]
-        right_title = arguments["right_title"]
-        right_content = arguments["right_content"]
-
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
-
-        prs = presentations[filename]
-        blank_slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(blank_slide_layout)
+        if ext == ".csv":
+            df = await asyncio.to_thread(
+                _load_data_file, data_file, columns=wanted_columns, st=st
+            )
 
-        # Add main title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.5), Inches(9), Inches(0.75)
-        )
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_frame.paragraphs[0].font.size = Pt(32)
-        title_frame.paragraphs[0].font.bold = True
-        title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-
-        # Left side
-        left_title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(1.5), Inches(4), Inches(0.5)
-        )
-        left_title_frame = left_title_box.text_frame
-        left_title_frame.text = left_title
-        left_title_frame.paragraphs[0].font.size = Pt(24)
-        left_title_frame.paragraphs[0].font.bold = True
-        left_title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-
-        left_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(2.2), Inches(4), Inches(4)
+        # Create chart
+        # Hand python-pptx the column arrays as-is; it iterates them once while
+        # writing the chart XML, so a tolist() copy per column buys nothing
+        chart_data = _category_chart_data(
+            df[x_column].astype(str).to_numpy(),
+            ((y_col, df[y_col].to_numpy()) for y_col in y_columns),
         )
-        left_tf = left_box.text_frame
-        for i, item in enumerate(left_content):
-            if i == 0:
-                left_tf.text = f"• {item}"
-            else:
-                p = left_tf.add_paragraph()
-                p.text = f"• {item}"
 
-        # Right side
-        right_title_box = slide.shapes.add_textbox(
-            Inches(5.5), Inches(1.5), Inches(4), Inches(0.5)
-        )
-        right_title_frame = right_title_box.text_frame
-        right_title_frame.text = right_title
-        right_title_frame.paragraphs[0].font.size = Pt(24)
-        right_title_frame.paragraphs[0].font.bold = True
-        right_title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-
-        right_box = slide.shapes.add_textbox(
-            Inches(5.5), Inches(2.2), Inches(4), Inches(4)
-        )
-        right_tf = right_box.text_frame
-        for i, item in enumerate(right_content):
-            if i == 0:
-                right_tf.text = f"• {item}"
-            else:
-                p = right_tf.add_paragraph()
-                p.text = f"• {item}"
+        # Auto-generate title if not provided
+        if not title:
+            title = f"{', '.join(y_columns)} by {x_column}"
 
-        # Add vertical divider line
-        from pptx.enum.shapes import MSO_CONNECTOR
+        slide = _add_blank_slide(prs)
+        _add_title_box(slide, title)
 
-        connector = slide.shapes.add_connector(
-            MSO_CONNECTOR.STRAIGHT, Inches(4.75), Inches(1.5), Inches(4.75), Inches(6.5)
-        )
-        connector.line.width = Pt(2)
+        x, y, cx, cy = CHART_BOX
+        chart = slide.shapes.add_chart(chart_enum, x, y, cx, cy, chart_data).chart
+        chart.has_legend = True
+        chart.legend.position = XL_LEGEND_POSITION.RIGHT
 
         return [
-            TextContent(type="text", text=f"Added comparison slide to '{filename}'")
+            TextContent(
+                type="text",
+                text=f"Analyzed '{data_file}' and added {chart_type} chart to '{filename}' ({len(df)} data points)",
+            )
         ]
 
-    elif name == "add_timeline_slide":
-        filename = arguments["filename"]
-        title = arguments["title"]
-        events = arguments["events"]
-
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
-
-        prs = presentations[filename]
-        blank_slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(blank_slide_layout)
-
-        # Add title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.5), Inches(9), Inches(0.75)
-        )
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_frame.paragraphs[0].font.size = Pt(32)
-        title_frame.paragraphs[0].font.bold = True
-
-        # Draw timeline line
-        from pptx.enum.shapes import MSO_CONNECTOR
-
-        connector = slide.shapes.add_connector(
-            MSO_CONNECTOR.STRAIGHT, Inches(1), Inches(3.5), Inches(9), Inches(3.5)
-        )
-        connector.line.width = Pt(3)
-        connector.line.color.rgb = RGBColor(68, 114, 196)
-
-        # Add events along timeline
-        event_count = len(events)
-        spacing = 8 / max(event_count - 1, 1)
-
-        for i, event in enumerate(events):
-            x_pos = 1 + (i * spacing)
-
+    except Exception as e:
+        return [TextContent(type="text", text=f"Error analyzing data: {str(e)}")]
+
+
+async def _handle_add_comparison_slide(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments["title"]
+    left_title = arguments["left_title"]
+    left_content = arguments["left_content"]
+    right_title = arguments["right_title"]
+    right_content = arguments["right_content"]
+
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    slide = _add_blank_slide(prs)
+
+    # Add main title
+    title_frame = _add_title_box(slide, title)
+    title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+
+    # Left side
+    left_title_box = slide.shapes.add_textbox(
+        Inches(0.5), Inches(1.5), Inches(4), Inches(0.5)
+    )
+    left_title_frame = left_title_box.text_frame
+    left_title_frame.text = left_title
+    left_para = left_title_frame.paragraphs[0]
+    left_font = left_para.font
+    left_font.size = Pt(24)
+    left_font.bold = True
+    left_para.alignment = PP_ALIGN.CENTER
+
+    left_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.2), Inches(4), Inches(4))
+    _fill_paragraphs(left_box.text_frame, [f"• {item}" for item in left_content])
+
+    # Right side
+    right_title_box = slide.shapes.add_textbox(
+        Inches(5.5), Inches(1.5), Inches(4), Inches(0.5)
+    )
+    right_title_frame = right_title_box.text_frame
+    right_title_frame.text = right_title
+    right_para = right_title_frame.paragraphs[0]
+    right_font = right_para.font
+    right_font.size = Pt(24)
+    right_font.bold = True
+    right_para.alignment = PP_ALIGN.CENTER
+
+    right_box = slide.shapes.add_textbox(Inches(5.5), Inches(2.2), Inches(4), Inches(4))
+    _fill_paragraphs(right_box.text_frame, [f"• {item}" for item in right_content])
+
+    # Add vertical divider line
+    connector = slide.shapes.add_connector(
+        MSO_CONNECTOR.STRAIGHT, Inches(4.75), Inches(1.5), Inches(4.75), Inches(6.5)
+    )
+    connector.line.width = Pt(2)
+
+    return [TextContent(type="text", text=f"Added comparison slide to '{filename}'")]
+
+
+async def _handle_add_timeline_slide(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments["title"]
+    events = arguments["events"]
+
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    error = _empty_list_error(arguments, "events")
+    if error:
+        return error
+
+    slide = _add_blank_slide(prs)
+
+    # Add title
+    _add_title_box(slide, title)
+
+    # Draw timeline line
+    connector = slide.shapes.add_connector(
+        MSO_CONNECTOR.STRAIGHT, Inches(1), Inches(3.5), Inches(9), Inches(3.5)
+    )
+    connector.line.width = Pt(3)
+    connector.line.color.rgb = ACCENT_BLUE
+
+    # Add events along timeline
+    event_count = len(events)
+    spacing = 8 / max(event_count - 1, 1)
+
+    # Sizes shared by every event
+    marker_top, marker_size = Inches(3.35), Inches(0.3)
+    date_top, date_width, date_height = Inches(2.5), Inches(1), Inches(0.5)
+    event_top, event_size = Inches(4), Inches(1.5)
+    date_font_size, event_font_size = Pt(12), Pt(10)
+
+    # Only the first event goes through the shape API; later events clone
+    # its three elements and patch just their position and text.
+    spTree = slide.shapes._spTree
+    templates = None
+    marker_dx, date_dx, event_dx = Inches(0.15), Inches(0.5), Inches(0.75)
+
+    for i, event in enumerate(events):
+        x_pos = Inches(1 + (i * spacing))
+
+        if templates is None:
             # Add marker circle
             shape = slide.shapes.add_shape(
                 MSO_SHAPE.OVAL,
-                Inches(x_pos - 0.15),
-                Inches(3.35),
-                Inches(0.3),
-                Inches(0.3),
+                x_pos - marker_dx,
+                marker_top,
+                marker_size,
+                marker_size,
             )
-            shape.fill.solid()
-            shape.fill.fore_color.rgb = RGBColor(68, 114, 196)
-            shape.line.color.rgb = RGBColor(68, 114, 196)
+            _set_solid_fill(shape._element.spPr, ACCENT_BLUE)
+            shape.line.color.rgb = ACCENT_BLUE
 
             # Add date
             date_box = slide.shapes.add_textbox(
-                Inches(x_pos - 0.5), Inches(2.5), Inches(1), Inches(0.5)
+                x_pos - date_dx, date_top, date_width, date_height
             )
             date_frame = date_box.text_frame
             date_frame.text = event["date"]
-            date_frame.paragraphs[0].font.size = Pt(12)
-            date_frame.paragraphs[0].font.bold = True
-            date_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+            date_para = date_frame.paragraphs[0]
+            date_font = date_para.font
+            date_font.size = date_font_size
+            date_font.bold = True
+            date_para.alignment = PP_ALIGN.CENTER
 
             # Add event description
             event_box = slide.shapes.add_textbox(
-                Inches(x_pos - 0.75), Inches(4), Inches(1.5), Inches(1.5)
+                x_pos - event_dx, event_top, event_size, event_size
             )
             event_frame = event_box.text_frame
             event_frame.text = event["event"]
-            event_frame.paragraphs[0].font.size = Pt(10)
-            event_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+            event_para = event_frame.paragraphs[0]
+            event_para.font.size = event_font_size
+            event_para.alignment = PP_ALIGN.CENTER
             event_frame.word_wrap = True
 
-        return [
-            TextContent(
-                type="text",
-                text=f"Added timeline slide to '{filename}' with {event_count} events",
+            templates = (shape._element, date_box._element, event_box._element)
+            next_id = spTree.max_shape_id + 1
+        else:
+            marker, date_el, event_el = templates
+            _clone_shape(spTree, marker, next_id, x_pos - marker_dx)
+            _clone_shape(spTree, date_el, next_id + 1, x_pos - date_dx, event["date"])
+            _clone_shape(
+                spTree,
+                event_el,
+                next_id + 2,
+                x_pos - event_dx,
+                event["event"],
             )
-        ]
+            next_id += 3
 
-    elif name == "format_text":
-        filename = arguments["filename"]
-        title = arguments["title"]
-        text_blocks = arguments["text_blocks"]
-
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    return [
+        TextContent(
+            type="text",
+            text=f"Added timeline slide to '{filename}' with {event_count} events",
+        )
+    ]
 
-        prs = presentations[filename]
-        blank_slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(blank_slide_layout)
 
-        # Add title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.5), Inches(9), Inches(0.75)
-        )
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_frame.paragraphs[0].font.size = Pt(32)
-        title_frame.paragraphs[0].font.bold = True
-
-        # Add formatted text blocks
-        y_offset = 1.5
-        for block in text_blocks:
-            text_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(y_offset), Inches(9), Inches(0.75)
+async def _handle_format_text(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments["title"]
+    text_blocks = arguments["text_blocks"]
+
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    error = _empty_list_error(arguments, "text_blocks") or _invalid_color_error(
+        block.get("color") for block in text_blocks
+    )
+    if error:
+        return error
+
+    slide = _add_blank_slide(prs)
+
+    # Add title
+    _add_title_box(slide, title)
+
+    # Add formatted text blocks, formatted as markup and appended in one pass
+    spTree = slide.shapes._spTree
+    shape_id = spTree.max_shape_id
+    shape_xml = []
+    y_offset = 1.5
+    for block in text_blocks:
+        shape_id += 1
+        shape_xml.append(
+            TEXTBOX_XML.format(
+                id=shape_id,
+                name_id=shape_id - 1,
+                x=TEXT_BLOCK_LEFT,
+                y=Inches(y_offset),
+                cx=TEXT_BLOCK_WIDTH,
+                cy=TEXT_BLOCK_HEIGHT,
+                paragraphs=_paragraphs_xml(block["text"], _text_block_pPr(block)),
             )
-            text_frame = text_box.text_frame
-            text_frame.text = block["text"]
-
-            para = text_frame.paragraphs[0]
-
-            # Apply formatting
-            if "font_size" in block:
-                para.font.size = Pt(block["font_size"])
-            if "bold" in block:
-                para.font.bold = block["bold"]
-            if "italic" in block:
-                para.font.italic = block["italic"]
-            if "font_name" in block:
-                para.font.name = block["font_name"]
-            if "color" in block:
-                # Parse hex color
-                hex_color = block["color"].lstrip("#")
-                r, g, b = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-                para.font.color.rgb = RGBColor(r, g, b)
-
-            y_offset += 0.75
+        )
+        y_offset += 0.75
+    _bulk_append_shapes(spTree, shape_xml)
 
-        return [
-            TextContent(type="text", text=f"Added formatted text slide to '{filename}'")
-        ]
+    return [
+        TextContent(type="text", text=f"Added formatted text slide to '{filename}'")
+    ]
 
-    elif name == "set_slide_background":
-        filename = arguments["filename"]
-        slide_index = arguments.get("slide_index", -1)
-        color = arguments.get("color")
-        gradient_colors = arguments.get("gradient_colors")
-        gradient_angle = arguments.get("gradient_angle", 135)
-        image_path = arguments.get("image_path")
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+async def _handle_set_slide_background(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    slide_index = arguments.get("slide_index", -1)
+    color = arguments.get("color")
+    gradient_colors = arguments.get("gradient_colors")
+    gradient_angle = arguments.get("gradient_angle", 135)
+    image_path = arguments.get("image_path")
 
-        prs = presentations[filename]
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        if slide_index == -1:
-            slide_index = len(prs.slides) - 1
+    if slide_index == -1:
+        slide_index = len(prs.slides) - 1
 
-        if slide_index < 0 or slide_index >= len(prs.slides):
-            return [
-                TextContent(
-                    type="text", text=f"Error: Invalid slide index {slide_index}"
-                )
-            ]
+    if slide_index < 0 or slide_index >= len(prs.slides):
+        return [
+            TextContent(type="text", text=f"Error: Invalid slide index {slide_index}")
+        ]
 
-        slide = prs.slides[slide_index]
+    error = _invalid_color_error([color, *(gradient_colors or ())])
+    if error:
+        return error
 
-        if gradient_colors:
-            _set_gradient_background(slide, gradient_colors, gradient_angle)
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Set gradient background for slide {slide_index} ({len(gradient_colors)} stops, {gradient_angle}°)",
-                )
-            ]
+    slide = prs.slides[slide_index]
 
-        if color:
-            fill = slide.background.fill
-            fill.solid()
-            hex_color = color.lstrip("#")
-            r, g, b = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-            fill.fore_color.rgb = RGBColor(r, g, b)
-            return [
-                TextContent(
-                    type="text", text=f"Set background color for slide {slide_index}"
-                )
-            ]
+    if gradient_colors:
+        _set_gradient_background(slide, gradient_colors, gradient_angle)
+        return [
+            TextContent(
+                type="text",
+                text=f"Set gradient background for slide {slide_index} ({len(gradient_colors)} stops, {gradient_angle}°)",
+            )
+        ]
 
-        if image_path:
-            if not os.path.exists(image_path):
-                return [
-                    TextContent(
-                        type="text", text=f"Error: Image file '{image_path}' not found."
-                    )
-                ]
-            slide.shapes.add_picture(
-                image_path,
+    if color:
+        _set_solid_background(slide, _rgb(color))
+        return [
+            TextContent(
+                type="text", text=f"Set background color for slide {slide_index}"
+            )
+        ]
+
+    if image_path:
+        # add_picture opens the file before touching the slide, so a missing
+        # image leaves the slide as it was
+        try:
+            if arguments.get("downscale_image"):
+                image = _downscaled_image(image_path, prs.slide_width, prs.slide_height)
+            else:
+                image = image_path
+            picture = slide.shapes.add_picture(
+                image,
                 Inches(0),
                 Inches(0),
                 width=prs.slide_width,
                 height=prs.slide_height,
             )
+            if image is not image_path:
+                _set_picture_descr(picture, image_path)
+        except FileNotFoundError:
             return [
                 TextContent(
-                    type="text", text=f"Set background image for slide {slide_index}"
+                    type="text", text=f"Error: Image file '{image_path}' not found."
                 )
             ]
-
+        # Move the picture behind the slide's other shapes; the shape tree's
+        # first two children are its own properties
+        slide.shapes._spTree.insert(2, picture._element)
         return [
             TextContent(
-                type="text",
-                text="Error: Provide 'color', 'gradient_colors', or 'image_path'",
+                type="text", text=f"Set background image for slide {slide_index}"
             )
         ]
 
-    elif name == "add_speaker_notes":
-        filename = arguments["filename"]
-        slide_index = arguments.get("slide_index", -1)
-        notes = arguments["notes"]
+    return [
+        TextContent(
+            type="text",
+            text="Error: Provide 'color', 'gradient_colors', or 'image_path'",
+        )
+    ]
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
 
-        prs = presentations[filename]
+async def _handle_add_speaker_notes(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    slide_index = arguments.get("slide_index", -1)
+    notes = arguments["notes"]
+
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    if slide_index == -1:
+        slide_index = len(prs.slides) - 1
+
+    if slide_index < 0 or slide_index >= len(prs.slides):
+        return [
+            TextContent(type="text", text=f"Error: Invalid slide index {slide_index}")
+        ]
+
+    slide = prs.slides[slide_index]
+    notes_slide = slide.notes_slide
+    text_frame = notes_slide.notes_text_frame
+    text_frame.text = notes
 
-        if slide_index == -1:
-            slide_index = len(prs.slides) - 1
+    return [
+        TextContent(type="text", text=f"Added speaker notes to slide {slide_index}")
+    ]
 
-        if slide_index < 0 or slide_index >= len(prs.slides):
-            return [
-                TextContent(
-                    type="text", text=f"Error: Invalid slide index {slide_index}"
-                )
-            ]
 
-        slide = prs.slides[slide_index]
-        notes_slide = slide.notes_slide
-        text_frame = notes_slide.notes_text_frame
-        text_frame.text = notes
+async def _handle_read_data_file(arguments: Any) -> list[TextContent]:
+    data_file = arguments["data_file"]
+    sheet_name = arguments.get("sheet_name")
 
+    try:
+        st = os.stat(data_file)
+    except OSError:
         return [
-            TextContent(type="text", text=f"Added speaker notes to slide {slide_index}")
+            TextContent(type="text", text=f"Error: Data file '{data_file}' not found.")
         ]
 
-    elif name == "read_data_file":
-        data_file = arguments["data_file"]
-        sheet_name = arguments.get("sheet_name")
+    try:
+        ext = os.path.splitext(data_file)[1].lower()
 
-        if not os.path.exists(data_file):
+        if ext in [".csv", ".xlsx", ".xls", ".json"]:
+            df = await asyncio.to_thread(_load_data_file, data_file, sheet_name, st=st)
+        else:
             return [
-                TextContent(
-                    type="text", text=f"Error: Data file '{data_file}' not found."
-                )
+                TextContent(type="text", text=f"Error: Unsupported file format '{ext}'")
             ]
 
-        try:
-            ext = os.path.splitext(data_file)[1].lower()
-
-            if ext == ".csv":
-                df = pd.read_csv(data_file)
-            elif ext in [".xlsx", ".xls"]:
-                if sheet_name:
-                    df = pd.read_excel(data_file, sheet_name=sheet_name)
-                else:
-                    df = pd.read_excel(data_file)
-            elif ext == ".json":
-                df = pd.read_json(data_file)
-            else:
-                return [
-                    TextContent(
-                        type="text", text=f"Error: Unsupported file format '{ext}'"
-                    )
-                ]
+        # Generate summary statistics
+        parts = [
+            f"Data File: {data_file}",
+            f"Rows: {len(df)}",
+            f"Columns: {len(df.columns)}\n",
+            "Column Names:",
+        ]
+        parts.extend(f"  - {col} ({dtype})" for col, dtype in df.dtypes.items())
+        preview = df.head().to_string(max_cols=DATA_PREVIEW_MAX_COLUMNS)
+        parts.append(f"\nFirst 5 rows:\n{preview}\n")
+
+        # Same columns describe() picks by default, capped so wide files don't
+        # pay for quantiles over every column
+        described = df.select_dtypes(include=["number", "datetime"])
+        if len(described.columns) == 0:
+            described = df
+        heading = "Summary Statistics"
+        if len(described.columns) > DATA_PREVIEW_MAX_COLUMNS:
+            heading += (
+                f" (first {DATA_PREVIEW_MAX_COLUMNS} of"
+                f" {len(described.columns)} columns)"
+            )
+            described = described.iloc[:, :DATA_PREVIEW_MAX_COLUMNS]
+        parts.append(f"{heading}:\n{described.describe().to_string()}")
 
-            # Generate summary statistics
-            summary = f"Data File: {data_file}\n"
-            summary += f"Rows: {len(df)}\n"
-            summary += f"Columns: {len(df.columns)}\n\n"
-            summary += "Column Names:\n"
-            for col in df.columns:
-                summary += f"  - {col} ({df[col].dtype})\n"
+        return [TextContent(type="text", text="\n".join(parts))]
 
-            summary += f"\nFirst 5 rows:\n{df.head().to_string()}\n\n"
-            summary += f"Summary Statistics:\n{df.describe().to_string()}"
+    except Exception as e:
+        return [TextContent(type="text", text=f"Error reading data file: {str(e)}")]
 
-            return [TextContent(type="text", text=summary)]
 
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error reading data file: {str(e)}")]
+# Shapes and Diagrams
+async def _handle_add_shape(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    slide_index = arguments.get("slide_index", -1)
+    shape_type = arguments["shape_type"]
+    left = Inches(arguments["left"])
+    top = Inches(arguments["top"])
+    width = Inches(arguments["width"])
+    height = Inches(arguments["height"])
+    fill_color = arguments.get("fill_color")
+    line_color = arguments.get("line_color")
+    text = arguments.get("text")
 
-    # Shapes and Diagrams
-    elif name == "add_shape":
-        filename = arguments["filename"]
-        slide_index = arguments.get("slide_index", -1)
-        shape_type = arguments["shape_type"]
-        left = Inches(arguments["left"])
-        top = Inches(arguments["top"])
-        width = Inches(arguments["width"])
-        height = Inches(arguments["height"])
-        fill_color = arguments.get("fill_color")
-        line_color = arguments.get("line_color")
-        text = arguments.get("text")
-
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        prs = presentations[filename]
-        if slide_index == -1:
-            slide_index = len(prs.slides) - 1
-        slide = prs.slides[slide_index]
-
-        # Map shape types
-        shape_map = {
-            "rectangle": MSO_SHAPE.RECTANGLE,
-            "circle": MSO_SHAPE.OVAL,
-            "triangle": MSO_SHAPE.ISOSCELES_TRIANGLE,
-            "arrow": MSO_SHAPE.BLOCK_ARC,
-            "star": MSO_SHAPE.STAR_5_POINT,
-            "pentagon": MSO_SHAPE.PENTAGON,
-            "hexagon": MSO_SHAPE.HEXAGON,
-        }
-
-        shape = slide.shapes.add_shape(shape_map[shape_type], left, top, width, height)
-
-        # Apply colors
-        if fill_color:
-            hex_color = fill_color.lstrip("#")
-            r, g, b = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-            shape.fill.solid()
-            shape.fill.fore_color.rgb = RGBColor(r, g, b)
-
-        if line_color:
-            hex_color = line_color.lstrip("#")
-            r, g, b = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-            shape.line.color.rgb = RGBColor(r, g, b)
-
-        # Add text if provided
-        if text and shape.has_text_frame:
-            shape.text_frame.text = text
-            shape.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+    if slide_index == -1:
+        slide_index = len(prs.slides) - 1
+    error = _invalid_color_error((fill_color, line_color))
+    if error:
+        return error
 
-        return [
-            TextContent(
-                type="text", text=f"Added {shape_type} shape to slide {slide_index}"
-            )
-        ]
+    slide = prs.slides[slide_index]
 
-    elif name == "add_connector":
-        filename = arguments["filename"]
-        slide_index = arguments.get("slide_index", -1)
-        connector_type = arguments["connector_type"]
-        start_x = Inches(arguments["start_x"])
-        start_y = Inches(arguments["start_y"])
-        end_x = Inches(arguments["end_x"])
-        end_y = Inches(arguments["end_y"])
-        line_width = arguments.get("line_width", 2)
-        line_color = arguments.get("line_color")
-
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    shape = slide.shapes.add_shape(SHAPE_TYPE_MAP[shape_type], left, top, width, height)
 
-        prs = presentations[filename]
-        if slide_index == -1:
-            slide_index = len(prs.slides) - 1
-        slide = prs.slides[slide_index]
+    # Apply colors
+    if fill_color:
+        _set_solid_fill(shape._element.spPr, _rgb(fill_color))
 
-        connector_map = {
-            "straight": MSO_CONNECTOR.STRAIGHT,
-            "elbow": MSO_CONNECTOR.ELBOW,
-            "curved": MSO_CONNECTOR.CURVE,
-        }
+    if line_color:
+        shape.line.color.rgb = _rgb(line_color)
 
-        connector = slide.shapes.add_connector(
-            connector_map[connector_type], start_x, start_y, end_x, end_y
+    # Add text if provided
+    if text and shape.has_text_frame:
+        shape.text_frame.text = text
+        shape.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+
+    return [
+        TextContent(
+            type="text", text=f"Added {shape_type} shape to slide {slide_index}"
         )
-        connector.line.width = Pt(line_width)
+    ]
 
-        if line_color:
-            hex_color = line_color.lstrip("#")
-            r, g, b = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-            connector.line.color.rgb = RGBColor(r, g, b)
 
-        return [
-            TextContent(
-                type="text",
-                text=f"Added {connector_type} connector to slide {slide_index}",
-            )
-        ]
+async def _handle_add_connector(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    slide_index = arguments.get("slide_index", -1)
+    connector_type = arguments["connector_type"]
+    start_x = Inches(arguments["start_x"])
+    start_y = Inches(arguments["start_y"])
+    end_x = Inches(arguments["end_x"])
+    end_y = Inches(arguments["end_y"])
+    line_width = arguments.get("line_width", 2)
+    line_color = arguments.get("line_color")
 
-    elif name == "add_flowchart":
-        filename = arguments["filename"]
-        title = arguments["title"]
-        steps = arguments["steps"]
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    if slide_index == -1:
+        slide_index = len(prs.slides) - 1
+    error = _invalid_color_error((line_color,))
+    if error:
+        return error
+
+    slide = prs.slides[slide_index]
+
+    connector = slide.shapes.add_connector(
+        CONNECTOR_TYPE_MAP[connector_type], start_x, start_y, end_x, end_y
+    )
+    connector.line.width = Pt(line_width)
 
-        prs = presentations[filename]
-        blank_slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(blank_slide_layout)
+    if line_color:
+        connector.line.color.rgb = _rgb(line_color)
 
-        # Add title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.5), Inches(9), Inches(0.75)
+    return [
+        TextContent(
+            type="text",
+            text=f"Added {connector_type} connector to slide {slide_index}",
         )
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_frame.paragraphs[0].font.size = Pt(32)
-        title_frame.paragraphs[0].font.bold = True
-
-        # Add flowchart steps
-        y_pos = 1.5
-        step_height = 0.8
-        step_spacing = 0.3
-
-        shape_map = {
-            "rectangle": MSO_SHAPE.RECTANGLE,
-            "diamond": MSO_SHAPE.DIAMOND,
-            "circle": MSO_SHAPE.OVAL,
-        }
-
-        for i, step in enumerate(steps):
-            shape_type = step.get("shape", "rectangle")
-            shape = slide.shapes.add_shape(
-                shape_map[shape_type],
-                Inches(3),
-                Inches(y_pos),
-                Inches(4),
-                Inches(step_height),
+    ]
+
+
+async def _handle_add_flowchart(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments["title"]
+    steps = arguments["steps"]
+
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    slide = _add_blank_slide(prs)
+
+    # Add title
+    _add_title_box(slide, title)
+
+    # Add flowchart steps; geometry is precomputed in EMU and every step
+    # and connector is parsed in one pass, then appended to the tree
+    y_pos = Inches(1.5)
+    step_height = Inches(0.8)
+    step_gap = Inches(0.3)
+    last_step = len(steps) - 1
+
+    # Sizes shared by every step
+    step_left, step_width, step_font_size = Inches(3), Inches(4), Pt(14)
+    connector_attrs = {"x": Inches(5), "cy": step_gap, "w": Pt(2)}
+
+    spTree = slide.shapes._spTree
+    shape_id = spTree.max_shape_id + 1
+    shape_xml = []
+    for i, step in enumerate(steps):
+        autoshape = FLOWCHART_SHAPE_MAP[step.get("shape", "rectangle")]
+        shape_xml.append(
+            _styled_shape_xml(
+                shape_id,
+                autoshape,
+                step_left,
+                y_pos,
+                step_width,
+                step_height,
+                ACCENT_BLUE,
+                font_size=step_font_size,
+                font_color=WHITE,
+                text=step["text"],
             )
-            shape.fill.solid()
-            shape.fill.fore_color.rgb = RGBColor(68, 114, 196)
-            shape.text_frame.text = step["text"]
-            shape.text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
-            shape.text_frame.paragraphs[0].font.size = Pt(14)
-            shape.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-
-            # Add connector to next step
-            if i < len(steps) - 1:
-                connector = slide.shapes.add_connector(
-                    MSO_CONNECTOR.STRAIGHT,
-                    Inches(5),
-                    Inches(y_pos + step_height),
-                    Inches(5),
-                    Inches(y_pos + step_height + step_spacing),
+        )
+        shape_id += 1
+        y_pos += step_height
+
+        # Add connector to next step
+        if i < last_step:
+            shape_xml.append(
+                FLOWCHART_CONNECTOR_XML.format(
+                    id=shape_id, n=shape_id - 1, y=y_pos, **connector_attrs
                 )
-                connector.line.width = Pt(2)
+            )
+            shape_id += 1
+        y_pos += step_gap
 
-            y_pos += step_height + step_spacing
+    _bulk_append_shapes(spTree, shape_xml)
 
-        return [
-            TextContent(type="text", text=f"Added flowchart with {len(steps)} steps")
-        ]
+    return [TextContent(type="text", text=f"Added flowchart with {len(steps)} steps")]
 
-    # Advanced Charts
-    elif name == "add_scatter_chart":
-        filename = arguments["filename"]
-        title = arguments["title"]
-        series = arguments["series"]
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+# Advanced Charts
+async def _handle_add_scatter_chart(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments["title"]
+    series = arguments["series"]
 
-        prs = presentations[filename]
-        blank_slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(blank_slide_layout)
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        # Add title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.5), Inches(9), Inches(0.75)
-        )
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_frame.paragraphs[0].font.size = Pt(32)
-        title_frame.paragraphs[0].font.bold = True
-
-        # Create scatter chart
-        chart_data = XyChartData()
-        for s in series:
-            xy_series = chart_data.add_series(s["name"])
-            for x, y in zip(s["x_values"], s["y_values"]):
-                xy_series.add_data_point(x, y)
-
-        x, y, cx, cy = Inches(1), Inches(1.5), Inches(8), Inches(5)
-        chart = slide.shapes.add_chart(
-            XL_CHART_TYPE.XY_SCATTER, x, y, cx, cy, chart_data
-        ).chart
-        chart.has_legend = True
-        chart.legend.position = XL_LEGEND_POSITION.RIGHT
+    error = _empty_list_error(arguments, "series")
+    if error:
+        return error
 
-        return [TextContent(type="text", text=f"Added scatter chart to '{filename}'")]
+    slide = _add_blank_slide(prs)
 
-    elif name == "add_bubble_chart":
-        filename = arguments["filename"]
-        title = arguments["title"]
-        series = arguments["series"]
+    # Add title
+    _add_title_box(slide, title)
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    # Create scatter chart
+    chart_data = XyChartData()
+    for s in series:
+        xy_series = chart_data.add_series(s["name"])
+        for x, y in zip(s["x_values"], s["y_values"]):
+            xy_series.add_data_point(x, y)
 
-        prs = presentations[filename]
-        blank_slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(blank_slide_layout)
+    x, y, cx, cy = CHART_BOX
+    chart = slide.shapes.add_chart(
+        XL_CHART_TYPE.XY_SCATTER, x, y, cx, cy, chart_data
+    ).chart
+    chart.has_legend = True
+    chart.legend.position = XL_LEGEND_POSITION.RIGHT
 
-        # Add title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.5), Inches(9), Inches(0.75)
-        )
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_frame.paragraphs[0].font.size = Pt(32)
-        title_frame.paragraphs[0].font.bold = True
-
-        # Create bubble chart
-        chart_data = BubbleChartData()
-        for s in series:
-            bubble_series = chart_data.add_series(s["name"])
-            for x, y, size in zip(s["x_values"], s["y_values"], s["sizes"]):
-                bubble_series.add_data_point(x, y, size)
-
-        x, y, cx, cy = Inches(1), Inches(1.5), Inches(8), Inches(5)
-        chart = slide.shapes.add_chart(
-            XL_CHART_TYPE.BUBBLE, x, y, cx, cy, chart_data
-        ).chart
-        chart.has_legend = True
-        chart.legend.position = XL_LEGEND_POSITION.RIGHT
+    return [TextContent(type="text", text=f"Added scatter chart to '{filename}'")]
 
-        return [TextContent(type="text", text=f"Added bubble chart to '{filename}'")]
 
-    # Multi-image layouts
-    elif name == "add_image_grid":
-        filename = arguments["filename"]
-        title = arguments.get("title", "Image Gallery")
-        images = arguments["images"]
-        columns = arguments.get("columns", 2)
+async def _handle_add_bubble_chart(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments["title"]
+    series = arguments["series"]
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        prs = presentations[filename]
-        blank_slide_layout = prs.slide_layouts[6]
-        slide = prs.slides.add_slide(blank_slide_layout)
+    error = _empty_list_error(arguments, "series")
+    if error:
+        return error
 
-        # Add title
-        title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(0.5), Inches(9), Inches(0.75)
-        )
-        title_frame = title_box.text_frame
-        title_frame.text = title
-        title_frame.paragraphs[0].font.size = Pt(32)
-        title_frame.paragraphs[0].font.bold = True
-
-        # Calculate grid layout
-        rows = (len(images) + columns - 1) // columns
-        img_width = 9 / columns - 0.2
-        img_height = 5 / rows - 0.2
-
-        for i, img_info in enumerate(images):
-            if not os.path.exists(img_info["path"]):
-                continue
+    slide = _add_blank_slide(prs)
 
-            row = i // columns
-            col = i % columns
+    # Add title
+    _add_title_box(slide, title)
 
-            left = Inches(0.5 + col * (img_width + 0.2))
-            top = Inches(1.5 + row * (img_height + 0.2))
+    # Create bubble chart
+    chart_data = BubbleChartData()
+    for s in series:
+        bubble_series = chart_data.add_series(s["name"])
+        for x, y, size in zip(s["x_values"], s["y_values"], s["sizes"]):
+            bubble_series.add_data_point(x, y, size)
 
-            slide.shapes.add_picture(
-                img_info["path"], left, top, width=Inches(img_width)
-            )
+    x, y, cx, cy = CHART_BOX
+    chart = slide.shapes.add_chart(XL_CHART_TYPE.BUBBLE, x, y, cx, cy, chart_data).chart
+    chart.has_legend = True
+    chart.legend.position = XL_LEGEND_POSITION.RIGHT
 
-            # Add caption if provided
-            if "caption" in img_info:
-                caption_box = slide.shapes.add_textbox(
-                    left,
-                    top + Inches(img_height) + Inches(0.05),
-                    Inches(img_width),
-                    Inches(0.15),
-                )
-                caption_box.text_frame.text = img_info["caption"]
-                caption_box.text_frame.paragraphs[0].font.size = Pt(8)
-                caption_box.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+    return [TextContent(type="text", text=f"Added bubble chart to '{filename}'")]
 
-        return [
-            TextContent(type="text", text=f"Added image grid with {len(images)} images")
-        ]
 
-    # Hyperlinks and QR Codes
-    elif name == "add_hyperlink":
-        filename = arguments["filename"]
-        slide_index = arguments.get("slide_index", -1)
-        text = arguments["text"]
-        url = arguments["url"]
-        left = Inches(arguments["left"])
-        top = Inches(arguments["top"])
-
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+# Multi-image layouts
+async def _handle_add_image_grid(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments.get("title", "Image Gallery")
+    images = arguments["images"]
+    columns = arguments.get("columns", 2)
 
-        prs = presentations[filename]
-        if slide_index == -1:
-            slide_index = len(prs.slides) - 1
-        slide = prs.slides[slide_index]
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        text_box = slide.shapes.add_textbox(left, top, Inches(3), Inches(0.5))
-        text_frame = text_box.text_frame
-        text_frame.text = text
+    slide = _add_blank_slide(prs)
 
-        # Add hyperlink
-        paragraph = text_frame.paragraphs[0]
-        run = paragraph.runs[0]
-        run.hyperlink.address = url
-        run.font.color.rgb = RGBColor(0, 0, 255)
-        run.font.underline = True
+    # Add title
+    _add_title_box(slide, title)
 
-        return [
-            TextContent(type="text", text=f"Added hyperlink to slide {slide_index}")
-        ]
+    # Calculate grid layout
+    rows = (len(images) + columns - 1) // columns
+    img_width = 9 / columns - 0.2
+    img_height = 5 / rows - 0.2
 
-    elif name == "add_qr_code":
-        filename = arguments["filename"]
-        slide_index = arguments.get("slide_index", -1)
-        data = arguments["data"]
-        left = Inches(arguments["left"])
-        top = Inches(arguments["top"])
-        size = Inches(arguments.get("size", 2))
+    # Cell positions and sizes, converted to EMU once per grid
+    col_lefts = [Inches(0.5 + col * (img_width + 0.2)) for col in range(columns)]
+    row_tops = [Inches(1.5 + row * (img_height + 0.2)) for row in range(rows)]
+    width = Inches(img_width)
+    caption_offset = Inches(img_height) + Inches(0.05)
+    caption_height = Inches(0.15)
+    caption_font_size = Pt(8)
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    # Pictures and captions are the only shapes added to the new slide,
+    # so shape ids can be counted up instead of rescanned per shape
+    slide.shapes.turbo_add_enabled = True
 
-        prs = presentations[filename]
-        if slide_index == -1:
-            slide_index = len(prs.slides) - 1
-        slide = prs.slides[slide_index]
+    for i, img_info in enumerate(images):
+        if not os.path.exists(img_info["path"]):
+            continue
 
-        # Generate QR code
-        qr = qrcode.QRCode(version=1, box_size=10, border=1)
-        qr.add_data(data)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
+        row, col = divmod(i, columns)
+        left = col_lefts[col]
+        top = row_tops[row]
 
-        # Save to temp file
-        temp_path = "/tmp/qr_temp.png"
-        img.save(temp_path)
+        slide.shapes.add_picture(img_info["path"], left, top, width=width)
 
-        # Add to slide
-        slide.shapes.add_picture(temp_path, left, top, width=size, height=size)
+        # Add caption if provided
+        if "caption" in img_info:
+            caption_box = slide.shapes.add_textbox(
+                left, top + caption_offset, width, caption_height
+            )
+            caption_box.text_frame.text = img_info["caption"]
+            caption_para = caption_box.text_frame.paragraphs[0]
+            caption_para.font.size = caption_font_size
+            caption_para.alignment = PP_ALIGN.CENTER
 
-        # Clean up
-        os.remove(temp_path)
+    return [
+        TextContent(type="text", text=f"Added image grid with {len(images)} images")
+    ]
 
-        return [TextContent(type="text", text=f"Added QR code to slide {slide_index}")]
 
-    # Sections and Organization
-    elif name == "add_section":
-        filename = arguments["filename"]
-        section_name = arguments["section_name"]
-        slide_index = arguments.get("slide_index", -1)
+# Hyperlinks and QR Codes
+async def _handle_add_hyperlink(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    slide_index = arguments.get("slide_index", -1)
+    text = arguments["text"]
+    url = arguments["url"]
+    left = Inches(arguments["left"])
+    top = Inches(arguments["top"])
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        prs = presentations[filename]
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+    if slide_index == -1:
+        slide_index = len(prs.slides) - 1
+    slide = prs.slides[slide_index]
 
-        if slide_index != -1:
-            sldIdLst = prs.slides._sldIdLst
-            new_elem = sldIdLst[-1]
-            sldIdLst.remove(new_elem)
-            sldIdLst.insert(slide_index, new_elem)
+    text_box = slide.shapes.add_textbox(left, top, Inches(3), Inches(0.5))
+    text_frame = text_box.text_frame
+    text_frame.text = text
 
-        # Create section break slide
-        slide.background.fill.solid()
-        slide.background.fill.fore_color.rgb = RGBColor(68, 114, 196)
+    # Add hyperlink
+    paragraph = text_frame.paragraphs[0]
+    run = paragraph.runs[0]
+    run.hyperlink.address = url
+    run.font.color.rgb = RGBColor(0, 0, 255)
+    run.font.underline = True
 
-        title_box = slide.shapes.add_textbox(
-            Inches(1), Inches(3), Inches(8), Inches(1.5)
-        )
-        title_frame = title_box.text_frame
-        title_frame.text = section_name
-        title_frame.paragraphs[0].font.size = Pt(54)
-        title_frame.paragraphs[0].font.bold = True
-        title_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
-        title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+    return [TextContent(type="text", text=f"Added hyperlink to slide {slide_index}")]
 
-        return [TextContent(type="text", text=f"Added section '{section_name}'")]
 
-    elif name == "add_agenda_slide":
-        filename = arguments["filename"]
-        title = arguments.get("title", "Agenda")
-        items = arguments["items"]
+async def _handle_add_qr_code(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    slide_index = arguments.get("slide_index", -1)
+    data = arguments["data"]
+    left = Inches(arguments["left"])
+    top = Inches(arguments["top"])
+    size = Inches(arguments.get("size", 2))
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        prs = presentations[filename]
-        bullet_slide_layout = prs.slide_layouts[1]
-        slide = prs.slides.add_slide(bullet_slide_layout)
+    if slide_index == -1:
+        slide_index = len(prs.slides) - 1
+    slide = prs.slides[slide_index]
 
-        shapes = slide.shapes
-        title_shape = shapes.title
-        body_shape = shapes.placeholders[1]
+    # Generate QR code (cached per data string) and add it from memory
+    slide.shapes.add_picture(
+        io.BytesIO(_qr_png(data)), left, top, width=size, height=size
+    )
 
-        title_shape.text = title
+    return [TextContent(type="text", text=f"Added QR code to slide {slide_index}")]
 
-        tf = body_shape.text_frame
-        for i, item in enumerate(items):
-            if i == 0:
-                tf.text = item
-            else:
-                p = tf.add_paragraph()
-                p.text = item
-                p.level = 0
 
-        return [
-            TextContent(type="text", text=f"Added agenda slide with {len(items)} items")
-        ]
+# Sections and Organization
+async def _handle_add_section(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    section_name = arguments["section_name"]
+    slide_index = arguments.get("slide_index", -1)
 
-    # Slide Operations
-    elif name == "duplicate_slide":
-        filename = arguments["filename"]
-        slide_index = arguments["slide_index"]
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    slide = _add_blank_slide(prs)
 
-        prs = presentations[filename]
-        if slide_index < 0 or slide_index >= len(prs.slides):
-            return [
-                TextContent(
-                    type="text", text=f"Error: Invalid slide index {slide_index}"
-                )
-            ]
+    if slide_index != -1:
+        sldIdLst = prs.slides._sldIdLst
+        new_elem = sldIdLst[-1]
+        sldIdLst.remove(new_elem)
+        sldIdLst.insert(slide_index, new_elem)
+
+    # Create section break slide
+    _set_solid_background(slide, ACCENT_BLUE)
+
+    title_box = slide.shapes.add_textbox(Inches(1), Inches(3), Inches(8), Inches(1.5))
+    title_frame = title_box.text_frame
+    title_frame.text = section_name
+    title_para = title_frame.paragraphs[0]
+    title_font = title_para.font
+    title_font.size = Pt(54)
+    title_font.bold = True
+    title_font.color.rgb = WHITE
+    title_para.alignment = PP_ALIGN.CENTER
+
+    return [TextContent(type="text", text=f"Added section '{section_name}'")]
 
-        from copy import deepcopy
 
-        source_slide = prs.slides[slide_index]
-        new_slide = prs.slides.add_slide(prs.slide_layouts[6])
+async def _handle_add_agenda_slide(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    title = arguments.get("title", "Agenda")
+    items = arguments["items"]
 
-        src_spTree = source_slide.shapes._spTree
-        new_spTree = new_slide.shapes._spTree
-        for el in list(new_spTree):
-            new_spTree.remove(el)
-        for el in src_spTree:
-            new_spTree.append(deepcopy(el))
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        if source_slide.has_notes_slide:
-            notes_text = source_slide.notes_slide.notes_text_frame.text
-            new_slide.notes_slide.notes_text_frame.text = notes_text
+    _add_bullet_slide(prs, title, items)
 
+    return [
+        TextContent(type="text", text=f"Added agenda slide with {len(items)} items")
+    ]
+
+
+# Slide Operations
+async def _handle_duplicate_slide(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    slide_index = arguments["slide_index"]
+
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    if slide_index < 0 or slide_index >= len(prs.slides):
         return [
-            TextContent(
-                type="text",
-                text=f"Duplicated slide {slide_index} — copy appended as slide {len(prs.slides) - 1}",
-            )
+            TextContent(type="text", text=f"Error: Invalid slide index {slide_index}")
         ]
 
-    elif name == "delete_slide":
-        filename = arguments["filename"]
-        slide_index = arguments["slide_index"]
+    source_slide = prs.slides[slide_index]
+    new_slide = _add_blank_slide(prs)
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    src_spTree = source_slide.shapes._spTree
+    new_spTree = new_slide.shapes._spTree
+    for el in list(new_spTree):
+        new_spTree.remove(el)
+    for el in src_spTree:
+        new_spTree.append(deepcopy(el))
+    # Pictures, charts and links in the copy point at the source's rIds
+    _remap_rids(new_spTree, _copy_slide_rels(source_slide.part, new_slide.part))
 
-        prs = presentations[filename]
-        if slide_index < 0 or slide_index >= len(prs.slides):
-            return [
-                TextContent(
-                    type="text", text=f"Error: Invalid slide index {slide_index}"
-                )
-            ]
+    if source_slide.has_notes_slide:
+        notes_text = source_slide.notes_slide.notes_text_frame.text
+        new_slide.notes_slide.notes_text_frame.text = notes_text
 
-        # Delete slide using rId
-        slide_id = prs.slides._sldIdLst[slide_index]
-        prs.slides._sldIdLst.remove(slide_id)
+    return [
+        TextContent(
+            type="text",
+            text=f"Duplicated slide {slide_index} — copy appended as slide {len(prs.slides) - 1}",
+        )
+    ]
 
-        return [TextContent(type="text", text=f"Deleted slide {slide_index}")]
 
-    elif name == "merge_presentations":
-        output_filename = arguments["output_filename"]
-        input_files = arguments["input_files"]
+async def _handle_delete_slide(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    slide_index = arguments["slide_index"]
 
-        from copy import deepcopy
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        merged = Presentation()
-        slide_count = 0
+    if slide_index < 0 or slide_index >= len(prs.slides):
+        return [
+            TextContent(type="text", text=f"Error: Invalid slide index {slide_index}")
+        ]
 
-        for input_file in input_files:
-            if input_file in presentations:
-                source_prs = presentations[input_file]
-            elif os.path.exists(input_file):
-                source_prs = Presentation(input_file)
-            else:
-                continue
+    # Delete slide using rId, then drop the relationship so the slide part
+    # (and anything only it references) is no longer written on save
+    sldIdLst = prs.slides._sldIdLst
+    slide_id = sldIdLst[slide_index]
+    sldIdLst.remove(slide_id)
+    prs.part.drop_rel(slide_id.rId)
+    # New slides are named slide<count + 1>.xml, so close the gap in the
+    # numbering or the next slide added would reuse a remaining slide's name
+    prs.part.rename_slide_parts([sldId.rId for sldId in sldIdLst])
+
+    return [TextContent(type="text", text=f"Deleted slide {slide_index}")]
+
+
+async def _handle_merge_presentations(arguments: Any) -> list[TextContent]:
+    output_filename = arguments["output_filename"]
+    input_files = arguments["input_files"]
+
+    # Files not already in memory are independent, so load them together,
+    # off the event loop
+    to_load = [f for f in input_files if f not in presentations and os.path.exists(f)]
+    merged, loaded = await asyncio.gather(
+        asyncio.to_thread(_new_presentation),
+        asyncio.to_thread(_load_presentations, to_load),
+    )
+    merged_slides = merged.slides
+    blank_slide_layout = merged.slide_layouts[6]
+    slide_count = 0
+
+    for input_file in input_files:
+        if input_file in presentations:
+            source_prs = presentations[input_file]
+        elif input_file in loaded:
+            source_prs = loaded[input_file]
+        else:
+            continue
+
+        for slide in source_prs.slides:
+            new_slide = merged_slides.add_slide(blank_slide_layout)
+            src_spTree = slide.shapes._spTree
+            new_spTree = new_slide.shapes._spTree
+            for el in list(new_spTree):
+                new_spTree.remove(el)
+            for el in src_spTree:
+                new_spTree.append(deepcopy(el))
+            _remap_rids(new_spTree, _copy_slide_rels(slide.part, new_slide.part))
+            slide_count += 1
+
+    presentations[output_filename] = merged
+    return [
+        TextContent(
+            type="text",
+            text=f"Merged {slide_count} slides from {len(input_files)} files into '{output_filename}'",
+        )
+    ]
 
-            for slide in source_prs.slides:
-                new_slide = merged.slides.add_slide(merged.slide_layouts[6])
-                src_spTree = slide.shapes._spTree
-                new_spTree = new_slide.shapes._spTree
-                for el in list(new_spTree):
-                    new_spTree.remove(el)
-                for el in src_spTree:
-                    new_spTree.append(deepcopy(el))
-                slide_count += 1
-
-        presentations[output_filename] = merged
+
+# Export
+async def _handle_export_to_pdf(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    output_path = arguments.get("output_path")
+
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
+        tmp_path = tmp.name
+    # LibreOffice reads the copy once and it is deleted straight after, so
+    # skip deflating it
+    _save_package(prs, tmp_path, "none")
+
+    if not output_path:
+        base = os.path.splitext(filename)[0]
+        output_path = os.path.join(DOWNLOADS_DIR, f"{base}.pdf")
+
+    output_dir = os.path.dirname(output_path) or HOME_DIR
+    _ensure_dir(output_dir)
+
+    try:
+        result = subprocess.run(
+            [
+                "libreoffice",
+                "--headless",
+                "--convert-to",
+                "pdf",
+                "--outdir",
+                output_dir,
+                tmp_path,
+            ],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        os.unlink(tmp_path)
+        if result.returncode == 0:
+            generated = os.path.join(
+                output_dir,
+                os.path.basename(tmp_path).replace(".pptx", ".pdf"),
+            )
+            if generated != output_path and os.path.exists(generated):
+                os.rename(generated, output_path)
+            return [TextContent(type="text", text=f"Exported PDF: {output_path}")]
+        return [TextContent(type="text", text=f"LibreOffice error: {result.stderr}")]
+    except FileNotFoundError:
+        os.unlink(tmp_path)
         return [
             TextContent(
                 type="text",
-                text=f"Merged {slide_count} slides from {len(input_files)} files into '{output_filename}'",
+                text="LibreOffice not found. Install with: brew install libreoffice",
             )
         ]
+    except subprocess.TimeoutExpired:
+        os.unlink(tmp_path)
+        return [TextContent(type="text", text="PDF export timed out")]
+
+
+# Templates and Themes
+async def _handle_apply_theme(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    theme = arguments["theme"]
+
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    theme_val = str(THEME_COLORS.get(theme, ACCENT_BLUE))
+    white_val = str(WHITE)
+    count = 0
+
+    # Recolor every non-white RGB solid fill on the slides' top-level
+    # autoshapes and text boxes, found with one XPath query per slide rather
+    # than through each shape's fill proxy; scheme-color fills are left alone
+    for slide in prs.slides:
+        for srgbClr in slide.shapes._spTree.xpath(
+            "./p:sp/p:spPr/a:solidFill/a:srgbClr"
+        ):
+            if srgbClr.get("val", "").upper() != white_val:
+                srgbClr.set("val", theme_val)
+                count += 1
 
-    # Export
-    elif name == "export_to_pdf":
-        filename = arguments["filename"]
-        output_path = arguments.get("output_path")
+    return [
+        TextContent(
+            type="text",
+            text=f"Applied '{theme}' theme — recolored {count} shapes",
+        )
+    ]
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
 
-        import subprocess
-        import tempfile
+async def _handle_add_footer(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    footer_text = arguments.get("footer_text", "")
+    show_page_numbers = arguments.get("show_page_numbers", True)
+    show_date = arguments.get("show_date", False)
+
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    # Add footer to all slides; each footer is formatted as markup and parsed
+    # in one pass, with the centred 10pt first paragraph add_textbox plus the
+    # font and alignment setters would produce
+    footer_pPr = f'<a:pPr algn="ctr"><a:defRPr sz="{Pt(10).centipoints}"/></a:pPr>'
+    x, y, cx, cy = Inches(0.5), Inches(7), Inches(8), Inches(0.3)
+    # Only the slide number varies; without it every footer is the same
+    number_prefix = f"{footer_text} | " if footer_text else ""
+    paragraphs = None if show_page_numbers else _paragraphs_xml(footer_text, footer_pPr)
+    for i, slide in enumerate(prs.slides):
+        spTree = slide.shapes._spTree
+        shape_id = spTree.max_shape_id + 1
+        footer_xml = TEXTBOX_XML.format(
+            id=shape_id,
+            name_id=shape_id - 1,
+            x=x,
+            y=y,
+            cx=cx,
+            cy=cy,
+            paragraphs=paragraphs
+            or _paragraphs_xml(f"{number_prefix}Slide {i + 1}", footer_pPr),
+        )
+        _bulk_append_shapes(spTree, [footer_xml])
+
+    return [
+        TextContent(type="text", text=f"Added footer to all {len(prs.slides)} slides")
+    ]
 
-        prs = presentations[filename]
 
-        with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-            tmp_path = tmp.name
-        prs.save(tmp_path)
+async def _handle_list_slides(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
 
-        if not output_path:
-            base = os.path.splitext(filename)[0]
-            output_path = os.path.join(
-                os.path.expanduser("~"), "Downloads", f"{base}.pdf"
-            )
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        output_dir = os.path.dirname(output_path) or os.path.expanduser("~")
-        os.makedirs(output_dir, exist_ok=True)
+    lines = [f"'{filename}' — {len(prs.slides)} slides\n"]
+    for i, slide in enumerate(prs.slides):
+        title = ""
+        for shape in slide.shapes:
+            if shape.has_text_frame and shape == slide.shapes.title:
+                title = shape.text_frame.text.strip()
+                break
+        if not title:
+            for shape in slide.shapes:
+                if shape.has_text_frame:
+                    t = shape.text_frame.text.strip()
+                    if t:
+                        title = t[:60]
+                        break
+        lines.append(f"  [{i}] {title or '(no text)'}")
 
-        try:
-            result = subprocess.run(
-                [
-                    "libreoffice",
-                    "--headless",
-                    "--convert-to",
-                    "pdf",
-                    "--outdir",
-                    output_dir,
-                    tmp_path,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-            os.unlink(tmp_path)
-            if result.returncode == 0:
-                generated = os.path.join(
-                    output_dir,
-                    os.path.basename(tmp_path).replace(".pptx", ".pdf"),
-                )
-                if generated != output_path and os.path.exists(generated):
-                    os.rename(generated, output_path)
-                return [TextContent(type="text", text=f"Exported PDF: {output_path}")]
-            return [
-                TextContent(type="text", text=f"LibreOffice error: {result.stderr}")
-            ]
-        except FileNotFoundError:
-            os.unlink(tmp_path)
-            return [
-                TextContent(
-                    type="text",
-                    text="LibreOffice not found. Install with: brew install libreoffice",
-                )
-            ]
-        except subprocess.TimeoutExpired:
-            os.unlink(tmp_path)
-            return [TextContent(type="text", text="PDF export timed out")]
+    return [TextContent(type="text", text="\n".join(lines))]
 
-    # Templates and Themes
-    elif name == "apply_theme":
-        filename = arguments["filename"]
-        theme = arguments["theme"]
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+async def _handle_get_slide_info(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    slide_index = arguments["slide_index"]
+
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
 
-        prs = presentations[filename]
+    if slide_index < 0 or slide_index >= len(prs.slides):
+        return [
+            TextContent(type="text", text=f"Error: Invalid slide index {slide_index}")
+        ]
 
-        # Define theme colors
-        themes = {
-            "blue": RGBColor(68, 114, 196),
-            "red": RGBColor(192, 0, 0),
-            "green": RGBColor(112, 173, 71),
-            "purple": RGBColor(112, 48, 160),
-            "orange": RGBColor(237, 125, 49),
-            "professional": RGBColor(31, 78, 121),
-            "modern": RGBColor(91, 155, 213),
-        }
+    slide = prs.slides[slide_index]
+    lines = [f"Slide {slide_index} — {len(slide.shapes)} shapes\n"]
+    for i, shape in enumerate(slide.shapes):
+        shape_desc = f"  shape[{i}]: {shape.shape_type.name}"
+        shape_desc += f'  pos=({shape.left / 914400:.2f}", {shape.top / 914400:.2f}")'
+        shape_desc += (
+            f'  size=({shape.width / 914400:.2f}" x {shape.height / 914400:.2f}")'
+        )
+        if shape.has_text_frame:
+            text = shape.text_frame.text.strip()
+            if text:
+                shape_desc += f'\n    text: "{text[:120]}"'
+        lines.append(shape_desc)
 
-        theme_color = themes.get(theme, RGBColor(68, 114, 196))
-        count = 0
+    if slide.has_notes_slide:
+        notes = slide.notes_slide.notes_text_frame.text.strip()
+        if notes:
+            lines.append(f'\nnotes: "{notes[:200]}"')
 
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                try:
-                    fill = shape.fill
-                    if fill.type == 1:  # MSO_FILL.SOLID
-                        current = fill.fore_color.rgb
-                        if current != RGBColor(255, 255, 255):
-                            fill.solid()
-                            fill.fore_color.rgb = theme_color
-                            count += 1
-                except Exception:
-                    pass
+    return [TextContent(type="text", text="\n".join(lines))]
+
+
+async def _handle_apply_design_preset(arguments: Any) -> list[TextContent]:
+    filename = arguments["filename"]
+    preset_name = arguments["preset"]
+    force = arguments.get("force", False)
+
+    prs, error = _get_presentation(filename)
+    if error:
+        return error
+
+    if filename in template_presentations and not force:
+        return [
+            TextContent(
+                type="text",
+                text=(
+                    f"'{filename}' was loaded from a template — skipping preset to preserve its design. "
+                    "Pass force=true to override."
+                ),
+            )
+        ]
 
+    preset = DESIGN_PRESETS.get(preset_name)
+    if not preset:
         return [
             TextContent(
                 type="text",
-                text=f"Applied '{theme}' theme — recolored {count} shapes",
+                text=f"Unknown preset '{preset_name}'. Available: {', '.join(DESIGN_PRESETS)}",
             )
         ]
 
-    elif name == "add_footer":
-        filename = arguments["filename"]
-        footer_text = arguments.get("footer_text", "")
-        show_page_numbers = arguments.get("show_page_numbers", True)
-        show_date = arguments.get("show_date", False)
+    accent_rects = _design_accent_rects(
+        prs.slide_width,
+        prs.slide_height,
+        preset["accent"],
+        preset["secondary"],
+        preset["accent_style"],
+    )
+    for slide in prs.slides:
+        _set_gradient_background(slide, preset["bg_colors"], preset["bg_angle"])
+        _add_design_accents(slide, accent_rects)
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+    return [
+        TextContent(
+            type="text",
+            text=f"Applied '{preset_name}' preset to all {len(prs.slides)} slides.",
+        )
+    ]
 
-        prs = presentations[filename]
 
-        # Add footer to all slides
-        for i, slide in enumerate(prs.slides):
-            footer_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(7), Inches(8), Inches(0.3)
-            )
-            footer_frame = footer_box.text_frame
-            footer_parts = []
+def _batch_op_arguments(filename, op):
+    """Return a batch operation's arguments, defaulting to the batch's file."""
+    op_arguments = op.get("arguments", {})
+    if filename is not None:
+        op_arguments = {"filename": filename, **op_arguments}
+    return op_arguments
 
-            if footer_text:
-                footer_parts.append(footer_text)
-            if show_page_numbers:
-                footer_parts.append(f"Slide {i + 1}")
 
-            footer_frame.text = " | ".join(footer_parts)
-            footer_frame.paragraphs[0].font.size = Pt(10)
-            footer_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+async def _handle_batch_operations(arguments: Any) -> list[TextContent]:
+    operations = arguments["operations"]
+    filename = arguments.get("filename")
 
+    if filename is not None and filename not in presentations:
         return [
             TextContent(
-                type="text", text=f"Added footer to all {len(prs.slides)} slides"
+                type="text", text=f"Error: Presentation '{filename}' not found."
             )
         ]
 
-    elif name == "list_slides":
-        filename = arguments["filename"]
-
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
-
-        prs = presentations[filename]
-        lines = [f"'{filename}' — {len(prs.slides)} slides\n"]
-        for i, slide in enumerate(prs.slides):
-            title = ""
-            for shape in slide.shapes:
-                if shape.has_text_frame and shape == slide.shapes.title:
-                    title = shape.text_frame.text.strip()
-                    break
-            if not title:
-                for shape in slide.shapes:
-                    if shape.has_text_frame:
-                        t = shape.text_frame.text.strip()
-                        if t:
-                            title = t[:60]
-                            break
-            lines.append(f"  [{i}] {title or '(no text)'}")
-
-        return [TextContent(type="text", text="\n".join(lines))]
-
-    elif name == "get_slide_info":
-        filename = arguments["filename"]
-        slide_index = arguments["slide_index"]
-
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
-
-        prs = presentations[filename]
-        if slide_index < 0 or slide_index >= len(prs.slides):
-            return [
-                TextContent(
-                    type="text", text=f"Error: Invalid slide index {slide_index}"
-                )
-            ]
+    # call_tool took the locks of every deck the operations touch, in order,
+    # before running the batch
+    held = frozenset(_lock_names("batch_operations", arguments))
+    lines = []
+    for i, op in enumerate(operations):
+        tool = op["tool"]
+        if tool == "batch_operations":
+            lines.append(f"[{i}] {tool}: Error: batches cannot be nested")
+            continue
+        text = await call_tool_text(tool, _batch_op_arguments(filename, op), held)
+        lines.append(f"[{i}] {tool}: {text}")
 
-        slide = prs.slides[slide_index]
-        lines = [f"Slide {slide_index} — {len(slide.shapes)} shapes\n"]
-        for i, shape in enumerate(slide.shapes):
-            shape_desc = f"  shape[{i}]: {shape.shape_type.name}"
-            shape_desc += (
-                f'  pos=({shape.left / 914400:.2f}", {shape.top / 914400:.2f}")'
-            )
-            shape_desc += (
-                f'  size=({shape.width / 914400:.2f}" x {shape.height / 914400:.2f}")'
-            )
-            if shape.has_text_frame:
-                text = shape.text_frame.text.strip()
-                if text:
-                    shape_desc += f'\n    text: "{text[:120]}"'
-            lines.append(shape_desc)
+    return [
+        TextContent(
+            type="text",
+            text=f"Ran {len(operations)} operations:\n" + "\n".join(lines),
+        )
+    ]
 
-        if slide.has_notes_slide:
-            notes = slide.notes_slide.notes_text_frame.text.strip()
-            if notes:
-                lines.append(f'\nnotes: "{notes[:200]}"')
 
-        return [TextContent(type="text", text="\n".join(lines))]
+# Tool name -> handler, built once so each call is a single dict lookup
+HANDLERS = {
+    "create_from_template": _handle_create_from_template,
+    "create_presentation": _handle_create_presentation,
+    "add_title_slide": _handle_add_title_slide,
+    "add_content_slide": _handle_add_content_slide,
+    "add_two_column_slide": _handle_add_two_column_slide,
+    "save_presentation": _handle_save_presentation,
+    "list_presentations": _handle_list_presentations,
+    "open_presentation": _handle_open_presentation,
+    "add_image_slide": _handle_add_image_slide,
+    "add_table_slide": _handle_add_table_slide,
+    "add_chart_slide": _handle_add_chart_slide,
+    "analyze_and_chart": _handle_analyze_and_chart,
+    "add_comparison_slide": _handle_add_comparison_slide,
+    "add_timeline_slide": _handle_add_timeline_slide,
+    "format_text": _handle_format_text,
+    "set_slide_background": _handle_set_slide_background,
+    "add_speaker_notes": _handle_add_speaker_notes,
+    "read_data_file": _handle_read_data_file,
+    "add_shape": _handle_add_shape,
+    "add_connector": _handle_add_connector,
+    "add_flowchart": _handle_add_flowchart,
+    "add_scatter_chart": _handle_add_scatter_chart,
+    "add_bubble_chart": _handle_add_bubble_chart,
+    "add_image_grid": _handle_add_image_grid,
+    "add_hyperlink": _handle_add_hyperlink,
+    "add_qr_code": _handle_add_qr_code,
+    "add_section": _handle_add_section,
+    "add_agenda_slide": _handle_add_agenda_slide,
+    "duplicate_slide": _handle_duplicate_slide,
+    "delete_slide": _handle_delete_slide,
+    "merge_presentations": _handle_merge_presentations,
+    "export_to_pdf": _handle_export_to_pdf,
+    "apply_theme": _handle_apply_theme,
+    "add_footer": _handle_add_footer,
+    "list_slides": _handle_list_slides,
+    "get_slide_info": _handle_get_slide_info,
+    "apply_design_preset": _handle_apply_design_preset,
+    "batch_operations": _handle_batch_operations,
+}
 
-    elif name == "apply_design_preset":
-        filename = arguments["filename"]
-        preset_name = arguments["preset"]
-        force = arguments.get("force", False)
 
-        if filename not in presentations:
-            return [
-                TextContent(
-                    type="text", text=f"Error: Presentation '{filename}' not found."
-                )
-            ]
+async def _run_tool(name: str, arguments: Any) -> list[TextContent]:
+    handler = HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    return await handler(arguments)
+
+
+def _lock_names(name: str, arguments: Any) -> list:
+    """Names of the presentations a tool call edits or reads, in lock order.
+
+    merge_presentations reads its input decks and replaces its output, and a
+    batch touches everything its operations do, so it can take all of its
+    locks up front; every other tool works on the one named by ``filename``.
+    Sorting gives all callers the same acquisition order.
+    """
+    if name == "merge_presentations":
+        names = {arguments.get("output_filename"), *arguments.get("input_files", ())}
+    elif name == "batch_operations":
+        filename = arguments.get("filename")
+        names = {filename}
+        for op in arguments.get("operations", ()):
+            tool = op.get("tool")
+            if tool != "batch_operations":
+                names.update(_lock_names(tool, _batch_op_arguments(filename, op)))
+    else:
+        names = {arguments.get("filename")}
+    names.discard(None)
+    return sorted(names)
+
+
+async def _run_tool_locked(
+    name: str, arguments: Any, held: frozenset = frozenset()
+) -> list[TextContent]:
+    """Run a tool holding the locks of the presentations it touches.
+
+    Locks in ``held`` are already owned by the caller and are not taken again.
+    Spilled presentations the tool needs are reopened first, and the store is
+    trimmed back to capacity once the locks are released.
+    """
+    names = _lock_names(name, arguments)
+    async with AsyncExitStack() as stack:
+        for lock_name in names:
+            if lock_name not in held:
+                await stack.enter_async_context(presentation_locks[lock_name])
+        await _load_spilled(names)
+        results = await _run_tool(name, arguments)
+    await _evict_presentations()
+    return results
+
+
+async def _load_spilled(names):
+    """Reopen any of the named presentations that were spilled, off the loop.
+
+    The caller holds the locks of ``names``, so no other call can reopen or
+    spill them meanwhile.
+    """
+    for name in names:
+        path = presentations.spilled_path(name)
+        if path is not None:
+            presentations[name] = await asyncio.to_thread(Presentation, path)
+
+
+async def _evict_presentations():
+    """Spill least recently used presentations until the store is in capacity.
+
+    Decks whose lock is held are in use, possibly being saved in a thread, and
+    are passed over. A deck's lock is held while it is written out, so no call
+    can pick it up half-spilled.
+    """
+    while presentations.over_capacity():
+        for name, prs in presentations.live_items():
+            lock = presentation_locks[name]
+            if not lock.locked():
+                break
+        else:
+            return
+        async with lock:
+            path = presentations.new_spill_path()
+            try:
+                await asyncio.to_thread(_save_package, prs, path, "fast")
+            except BaseException:
+                os.unlink(path)
+                raise
+            presentations.mark_spilled(name, prs, path)
 
-        if filename in template_presentations and not force:
-            return [
-                TextContent(
-                    type="text",
-                    text=(
-                        f"'{filename}' was loaded from a template — skipping preset to preserve its design. "
-                        "Pass force=true to override."
-                    ),
-                )
-            ]
 
-        preset = DESIGN_PRESETS.get(preset_name)
-        if not preset:
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Unknown preset '{preset_name}'. Available: {', '.join(DESIGN_PRESETS)}",
-                )
-            ]
+@app.call_tool()
+async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+    """Handle tool calls"""
+    return await _run_tool_locked(name, arguments)
 
-        prs = presentations[filename]
-        for slide in prs.slides:
-            _set_gradient_background(slide, preset["bg_colors"], preset["bg_angle"])
-            _add_design_accents(
-                slide, preset["accent"], preset["secondary"], preset["accent_style"]
-            )
 
-        return [
-            TextContent(
-                type="text",
-                text=f"Applied '{preset_name}' preset to all {len(prs.slides)} slides.",
-            )
-        ]
+async def call_tool_text(name: str, arguments: Any, held: frozenset) -> str:
+    """Run a tool from inside batch_operations and return its reply as text.
 
-    else:
-        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    The batch took the locks in ``held`` for every deck its operations touch,
+    so the operation takes none of its own. Every handler replies with a
+    single TextContent, so that case skips the join over the result list.
+    """
+    results = await _run_tool_locked(name, arguments, held)
+    if len(results) == 1:
+        return results[0].text
+    return "\n".join(r.text for r in results)
 
 
 async def main():
@@ -2807,4 +3664,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; fall back to the default event loop without it
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())